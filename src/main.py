@@ -2,30 +2,44 @@ import flet as ft
 import mss
 import threading
 import time
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 import multiprocessing
+import queue
+import struct
+import zlib
+from multiprocessing import shared_memory
 import tempfile
 import json
+import logging
+import logging.handlers
+import atexit
+import base64
 import os
-import imageio.v2 as imageio
+import random
+import re
+import urllib.error
+from PIL import Image
 
 # monkey patch distutils
 import sys
-from types import ModuleType
+from types import ModuleType, MappingProxyType
 
 # Create a mock distutils module, dependecy of argostranslate
 distutils_module = ModuleType('distutils')
 distutils_util_module = ModuleType('distutils.util')
 
+TRUTH_VALUES = MappingProxyType({
+    'y': True, 'yes': True, 't': True, 'true': True, 'on': True, '1': True,
+    'n': False, 'no': False, 'f': False, 'false': False, 'off': False, '0': False,
+})
+
 def strtobool(val):
     """Convert a string representation of truth to True or False."""
     val = val.lower()
-    if val in ('y', 'yes', 't', 'true', 'on', '1'):
-        return True
-    elif val in ('n', 'no', 'f', 'false', 'off', '0'):
-        return False
-    else:
+    result = TRUTH_VALUES.get(val)
+    if result is None:
         raise ValueError(f"invalid truth value {val!r}")
+    return result
 
 distutils_util_module.strtobool = strtobool
 distutils_module.util = distutils_util_module
@@ -35,12 +49,14 @@ sys.modules['distutils.util'] = distutils_util_module
 
 import argostranslate.package
 import argostranslate.translate
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce, lru_cache
 from abc import ABC, abstractmethod
 import cv2
 import numpy as np
 
-import traceback
 from ui.components import (
     FactoryButton, FactorySecondaryButton, FactoryTextField, FactoryCheckBox,
     FactoryDropdown, FactoryDropdownOption, FactoryCard, FactoryField,
@@ -53,12 +69,67 @@ try:
 except ImportError:
     OCRMAC_AVAILABLE = False
 
+try:
+    import orjson
+    dumps_json = orjson.dumps
+    loads_json = orjson.loads
+except ImportError:
+    def dumps_json(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    loads_json = json.loads
+
+# Diagnostics go through logging so hot-path messages cost nothing unless enabled,
+# e.g. POLYGLOT_LOG_LEVEL=DEBUG
+log = logging.getLogger("polyglot")
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Route records through a queue so worker threads never block on stderr"""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(queue.SimpleQueue(), handler)
+    log.addHandler(logging.handlers.QueueHandler(listener.queue))
+    log.setLevel(os.environ.get("POLYGLOT_LOG_LEVEL", "INFO").upper())
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Failures worth retrying; anything else is permanent and surfaces immediately
+TRANSIENT_ERRORS = (ConnectionError, TimeoutError, urllib.error.URLError)
+
+# Map common language codes to IANA language tags for ocrmac
+LANGUAGE_CODES = MappingProxyType({
+    'en': 'en-US',      # English
+    'es': 'es-ES',      # Spanish  
+    'fr': 'fr-FR',      # French
+    'de': 'de-DE',      # German
+    'it': 'it-IT',      # Italian
+    'pt': 'pt-PT',      # Portuguese
+    'ru': 'ru-RU',      # Russian
+    'ja': 'ja-JP',      # Japanese
+    'ko': 'ko-KR',      # Korean
+    'zh': 'zh-Hans',    # Chinese (Simplified)
+    'ar': 'ar-SA',      # Arabic
+    'hi': 'hi-IN',      # Hindi
+    'nl': 'nl-NL',      # Dutch
+    'sv': 'sv-SE',      # Swedish
+    'da': 'da-DK',      # Danish
+    'no': 'no-NO',      # Norwegian
+    'fi': 'fi-FI',      # Finnish
+    'pl': 'pl-PL',      # Polish
+    'cs': 'cs-CZ',      # Czech
+    'sk': 'sk-SK',      # Slovak
+})
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+# Value objects drop their per-instance __dict__ where the interpreter supports it (3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Region:
     x: int
     y: int
@@ -72,7 +143,7 @@ class Region:
     def from_dict(cls, data: dict):
         return cls(data["x"], data["y"], data["width"], data["height"])
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SubtitleData:
     original_text: str
     translated_text: str
@@ -80,12 +151,9 @@ class SubtitleData:
     source_language: str
     target_language: str
     confidence: float = 1.0
-    timestamp: float = 0.0
-    
-    def __post_init__(self):
-        self.timestamp = time.time()
+    timestamp: float = field(default_factory=time.time)
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TranslationSettings:
     enabled: bool = False
     source_language: str = "en"
@@ -115,181 +183,276 @@ class Observer(ABC):
 
 class Observable:
     def __init__(self):
-        self._observers = []
+        # Keyed by id() for O(1) add/remove; dicts keep registration order for dispatch
+        self._observers: Dict[int, Observer] = {}
     
     def add_observer(self, observer: Observer):
-        self._observers.append(observer)
+        self._observers[id(observer)] = observer
     
     def remove_observer(self, observer: Observer):
-        if observer in self._observers:
-            self._observers.remove(observer)
+        self._observers.pop(id(observer), None)
     
     def notify_observers(self, event_type: str, data: Any = None):
-        for observer in self._observers:
+        # Snapshot so observers can (un)register while an event is being dispatched
+        for observer in tuple(self._observers.values()):
+            # One failing observer must not keep the event from the rest
             try:
                 observer.update(event_type, data)
-            except Exception as e:
-                print(f"Observer error: {e}")
+            except Exception:
+                log.exception("Observer error")
 
 # ============================================================================
 # CORE SERVICES (Keep existing services unchanged)
 # ============================================================================
 
+def open_shared_memory(name: str, size: int, reclaim: bool = False) -> Tuple[shared_memory.SharedMemory, bool]:
+    """Create a named segment, or attach to it if another process already did. Returns (segment, owner)
+    
+    With reclaim (the main app, which always starts first) an existing segment can only be
+    left over from a crash, so it is unlinked and created fresh instead of attached to.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, create=True, size=size), True
+    except FileExistsError:
+        if not reclaim:
+            return shared_memory.SharedMemory(name=name), False
+    stale = shared_memory.SharedMemory(name=name)
+    stale.close()
+    stale.unlink()
+    return shared_memory.SharedMemory(name=name, create=True, size=size), True
+
 class RegionSelectionService:
-    def __init__(self):
-        self.temp_file = os.path.join(tempfile.gettempdir(), 'ocr_region_selection.json')
+    """Shares the selected region between the selector subprocess and the main app"""
+    SHM_NAME = 'polyglot_region'
+    # valid flag followed by x, y, width, height
+    LAYOUT = struct.Struct('<5i')
+    
+    def __init__(self, reclaim: bool = False):
+        # The main app creates (or reclaims) the segment, the selector process attaches to it
+        self._shm, self._owner = open_shared_memory(self.SHM_NAME, self.LAYOUT.size, reclaim)
+        self._closed = False
     
     def save_region(self, region: Optional[Region]):
         try:
-            with open(self.temp_file, 'w') as f:
-                json.dump(region.to_dict() if region else None, f)
+            if region:
+                # Write the coordinates before raising the flag so a reader never sees a partial region
+                struct.pack_into('<4i', self._shm.buf, 4, region.x, region.y, region.width, region.height)
+                struct.pack_into('<i', self._shm.buf, 0, 1)
+            else:
+                struct.pack_into('<i', self._shm.buf, 0, 0)
         except Exception as e:
-            print(f"Error saving region: {e}")
+            log.error("Error saving region: %s", e)
     
     def load_region(self) -> Optional[Region]:
         try:
-            if os.path.exists(self.temp_file):
-                with open(self.temp_file, 'r') as f:
-                    data = json.load(f)
-                    return Region.from_dict(data) if data else None
+            valid, x, y, width, height = self.LAYOUT.unpack_from(self._shm.buf)
+            return Region(x, y, width, height) if valid else None
         except Exception as e:
-            print(f"Error loading region: {e}")
+            log.error("Error loading region: %s", e)
         return None
     
     def clear_region(self):
+        self.save_region(None)
+    
+    def close(self):
+        """Release the segment, removing it if this instance created it"""
+        if self._closed:
+            return
+        self._closed = True
         try:
-            if os.path.exists(self.temp_file):
-                os.remove(self.temp_file)
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
         except Exception as e:
-            print(f"Error clearing region: {e}")
+            log.error("Error closing region storage: %s", e)
 
 class TranslationService:
-    def __init__(self):
+    def __init__(self, on_packages_loaded: Optional[Callable[[], None]] = None):
         self.available_packages = []
         self.installed_packages = []
-        self._load_packages()
+        self.packages_loaded = False
+        self.on_packages_loaded = on_packages_loaded
+        
+        # Adjacency graphs and path lookups, rebuilt whenever packages change
+        self._installed_graph: Dict[str, List[str]] = {}
+        self._installed_reverse_graph: Dict[str, List[str]] = {}
+        self._available_graph: Dict[str, List[str]] = {}
+        self._available_reverse_graph: Dict[str, List[str]] = {}
+        self._path_cache: Dict[Tuple[str, str], list] = {}
+        self._available_path_cache: Dict[Tuple[str, str], list] = {}
+        self._translator_cache: Dict[Tuple[str, str], Callable[[str], str]] = {}
+        self._pipeline_cache: Dict[Tuple[str, str], Callable[[str], str]] = {}
+        
+        # Recent (text, from, to) -> translation results; subtitles linger on screen for
+        # many frames, and titles or catchphrases recur throughout a video
+        self._recent_translations: OrderedDict = OrderedDict()
+        self._recent_translations_size = 512
+        self._recent_translations_lock = threading.Lock()
+        
+        # Exponential backoff for transient failures: 200ms, 400ms, ... with ±25% jitter
+        self._retry_attempts = 3
+        self._retry_base_delay = 0.2
+        
+        # Caps concurrent model inference so parallel callers can't oversubscribe the CPU/GPU
+        self._translate_sem = threading.BoundedSemaphore(
+            int(os.environ.get("POLYGLOT_TRANSLATE_CONCURRENCY", "2"))
+        )
+        
+        # Installed packages are local and fast; the package index needs the network,
+        # so it is fetched in the background and on_packages_loaded fires when it's done
+        self._load_installed_packages()
+        threading.Thread(target=self._load_packages, daemon=True).start()
     
-    def _load_packages(self):
+    def _load_installed_packages(self):
         try:
-            argostranslate.package.update_package_index()
-            self.available_packages = argostranslate.package.get_available_packages()
             self.installed_packages = argostranslate.package.get_installed_packages()
-            print(f"Loaded {len(self.installed_packages)} installed translation packages")
+            log.info("Loaded %s installed translation packages", len(self.installed_packages))
                 
         except Exception as e:
-            print(f"Error loading translation packages: {e}")
+            log.error("Error loading installed translation packages: %s", e)
+        
+        self._refresh_installed()
+    
+    def _load_packages(self):
+        """Fetch the remote package index and rebuild the available graph"""
+        try:
+            self._with_retry(argostranslate.package.update_package_index)
+            available_packages = argostranslate.package.get_available_packages()
+            
+            self._available_graph = self._build_graph(available_packages)
+            self._available_reverse_graph = self._build_graph(available_packages, reverse=True)
+            self.available_packages = available_packages
+            # Swap in a fresh cache so a lookup racing with the load can't leave a stale entry behind
+            self._available_path_cache = {}
+            log.info("Loaded %s available translation packages", len(self.available_packages))
+                
+        except Exception as e:
+            log.error("Error loading translation packages: %s", e)
+        
+        self.packages_loaded = True
+        if self.on_packages_loaded:
+            self.on_packages_loaded()
+    
+    def _refresh_installed(self):
+        """Rebuild the installed graph and drop cached paths that depend on it"""
+        self._installed_graph = self._build_graph(self.installed_packages)
+        self._installed_reverse_graph = self._build_graph(self.installed_packages, reverse=True)
+        self._path_cache.clear()
+        self._translator_cache.clear()
+        self._pipeline_cache.clear()
+        with self._recent_translations_lock:
+            self._recent_translations.clear()
+    
+    @staticmethod
+    def _build_graph(packages, reverse: bool = False) -> Dict[str, List[str]]:
+        """Build a from_code -> [to_code] adjacency map of translation packages (to -> [from] if reverse)"""
+        graph = {}
+        for package in packages:
+            if reverse:
+                graph.setdefault(package.to_code, []).append(package.from_code)
+            else:
+                graph.setdefault(package.from_code, []).append(package.to_code)
+        return graph
     
     def is_package_installed(self, from_lang: str, to_lang: str) -> bool:
         """Check if direct translation package is installed"""
-        for package in self.installed_packages:
-            if package.from_code == from_lang and package.to_code == to_lang:
-                return True
-        return False
+        return to_lang in self._installed_graph.get(from_lang, ())
     
     def is_package_available(self, from_lang: str, to_lang: str) -> bool:
         """Check if direct translation package is available for download"""
-        for package in self.available_packages:
-            if package.from_code == from_lang and package.to_code == to_lang:
-                return True
-        return False
+        return to_lang in self._available_graph.get(from_lang, ())
     
     def find_translation_path(self, from_lang: str, to_lang: str) -> list:
         """
         Find shortest translation path using installed packages.
         Always tries English as intermediate language first since it's most common.
         """
-        if from_lang == to_lang:
-            return [from_lang]
-        
-        # Check for direct translation first
-        if self.is_package_installed(from_lang, to_lang):
-            return [from_lang, to_lang]
-        
-        # For non-English languages, try via English first (most common path)
-        if from_lang != 'en' and to_lang != 'en':
-            if (self.is_package_installed(from_lang, 'en') and 
-                self.is_package_installed('en', to_lang)):
-                return [from_lang, 'en', to_lang]
-        
-        # If English path doesn't work, do full BFS
-        return self._bfs_translation_path(from_lang, to_lang)
+        key = (from_lang, to_lang)
+        if key not in self._path_cache:
+            self._path_cache[key] = self._find_path(
+                self._installed_graph, self._installed_reverse_graph, from_lang, to_lang
+            )
+        return self._path_cache[key]
     
     def find_available_translation_path(self, from_lang: str, to_lang: str) -> list:
         """
         Find shortest translation path using available packages.
         Always tries English as intermediate language first.
         """
+        key = (from_lang, to_lang)
+        if key not in self._available_path_cache:
+            self._available_path_cache[key] = self._find_path(
+                self._available_graph, self._available_reverse_graph, from_lang, to_lang
+            )
+        return self._available_path_cache[key]
+    
+    @classmethod
+    def _find_path(cls, graph: Dict[str, List[str]], reverse_graph: Dict[str, List[str]],
+                   from_lang: str, to_lang: str) -> list:
+        """Shortest path over a package graph, preferring English as the pivot"""
         if from_lang == to_lang:
             return [from_lang]
         
         # Check for direct translation first
-        if self.is_package_available(from_lang, to_lang):
+        if to_lang in graph.get(from_lang, ()):
             return [from_lang, to_lang]
         
-        # For non-English languages, try via English first
+        # For non-English languages, try via English first (most common path)
         if from_lang != 'en' and to_lang != 'en':
-            if (self.is_package_available(from_lang, 'en') and 
-                self.is_package_available('en', to_lang)):
+            if 'en' in graph.get(from_lang, ()) and to_lang in graph.get('en', ()):
                 return [from_lang, 'en', to_lang]
         
-        # If English path doesn't work, do full BFS on available packages
-        return self._bfs_available_translation_path(from_lang, to_lang)
+        # If English path doesn't work, do full BFS
+        return cls._bfs(graph, reverse_graph, from_lang, to_lang)
     
-    def _bfs_translation_path(self, from_lang: str, to_lang: str) -> list:
-        """BFS for installed packages"""
-        from collections import deque
-        
-        # Build graph of installed translations
-        available_translations = {}
-        for package in self.installed_packages:
-            if package.from_code not in available_translations:
-                available_translations[package.from_code] = []
-            available_translations[package.from_code].append(package.to_code)
+    @staticmethod
+    def _bfs(graph: Dict[str, List[str]], reverse_graph: Dict[str, List[str]],
+             from_lang: str, to_lang: str, max_hops: int = 3) -> list:
+        """Bidirectional BFS for the shortest path of at most max_hops packages"""
+        if from_lang == to_lang:
+            return [from_lang]
         
-        # BFS
-        queue = deque([(from_lang, [from_lang])])
-        visited = {from_lang}
+        # Paths from the source to each reached node, and from each reached node to the target
+        fwd = {from_lang: [from_lang]}
+        bwd = {to_lang: [to_lang]}
+        fwd_frontier = [from_lang]
+        bwd_frontier = [to_lang]
         
-        while queue:
-            current_lang, path = queue.popleft()
+        for _ in range(max_hops):
+            if not fwd_frontier or not bwd_frontier:
+                break
             
-            if current_lang == to_lang:
-                return path
-            
-            if current_lang in available_translations and len(path) < 4:
-                for next_lang in available_translations[current_lang]:
-                    if next_lang not in visited:
-                        visited.add(next_lang)
-                        queue.append((next_lang, path + [next_lang]))
-        
-        return []
-    
-    def _bfs_available_translation_path(self, from_lang: str, to_lang: str) -> list:
-        """BFS for available packages"""
-        from collections import deque
-        
-        # Build graph of available translations
-        available_translations = {}
-        for package in self.available_packages:
-            if package.from_code not in available_translations:
-                available_translations[package.from_code] = []
-            available_translations[package.from_code].append(package.to_code)
-        
-        # BFS
-        queue = deque([(from_lang, [from_lang])])
-        visited = {from_lang}
-        
-        while queue:
-            current_lang, path = queue.popleft()
+            best = []
+            next_frontier = []
             
-            if current_lang == to_lang:
-                return path
+            # Expand the smaller frontier by one level
+            if len(fwd_frontier) <= len(bwd_frontier):
+                for current_lang in fwd_frontier:
+                    for next_lang in graph.get(current_lang, ()):
+                        if next_lang in fwd:
+                            continue
+                        fwd[next_lang] = fwd[current_lang] + [next_lang]
+                        next_frontier.append(next_lang)
+                        if next_lang in bwd:
+                            path = fwd[next_lang] + bwd[next_lang][1:]
+                            if not best or len(path) < len(best):
+                                best = path
+                fwd_frontier = next_frontier
+            else:
+                for current_lang in bwd_frontier:
+                    for prev_lang in reverse_graph.get(current_lang, ()):
+                        if prev_lang in bwd:
+                            continue
+                        bwd[prev_lang] = [prev_lang] + bwd[current_lang]
+                        next_frontier.append(prev_lang)
+                        if prev_lang in fwd:
+                            path = fwd[prev_lang] + bwd[prev_lang][1:]
+                            if not best or len(path) < len(best):
+                                best = path
+                bwd_frontier = next_frontier
             
-            if current_lang in available_translations and len(path) < 4:
-                for next_lang in available_translations[current_lang]:
-                    if next_lang not in visited:
-                        visited.add(next_lang)
-                        queue.append((next_lang, path + [next_lang]))
+            if best:
+                return best
         
         return []
     
@@ -328,16 +491,17 @@ class TranslationService:
                     break
             
             if package_to_install:
-                print(f"Installing {from_lang} → {to_lang} package...")
-                argostranslate.package.install_from_path(package_to_install.download())
+                log.info("Installing %s → %s package...", from_lang, to_lang)
+                argostranslate.package.install_from_path(self._with_retry(package_to_install.download))
                 self.installed_packages = argostranslate.package.get_installed_packages()
-                print(f"Successfully installed {from_lang} → {to_lang}")
+                self._refresh_installed()
+                log.info("Successfully installed %s → %s", from_lang, to_lang)
                 return True
             else:
-                print(f"Package {from_lang} → {to_lang} not found in available packages")
+                log.warning("Package %s → %s not found in available packages", from_lang, to_lang)
                 return False
         except Exception as e:
-            print(f"Error installing package {from_lang} → {to_lang}: {e}")
+            log.error("Error installing package %s → %s: %s", from_lang, to_lang, e)
             return False
     
     def install_translation_path(self, from_lang: str, to_lang: str) -> bool:
@@ -346,140 +510,223 @@ class TranslationService:
         
         if not required_packages:
             if self.can_translate(from_lang, to_lang):
-                print(f"Translation path {from_lang} → {to_lang} already available")
+                log.info("Translation path %s → %s already available", from_lang, to_lang)
                 return True
             else:
-                print(f"No translation path available for {from_lang} → {to_lang}")
+                log.warning("No translation path available for %s → %s", from_lang, to_lang)
                 return False
         
-        print(f"Installing translation path {from_lang} → {to_lang}")
-        print(f"Required packages: {required_packages}")
+        log.info("Installing translation path %s → %s", from_lang, to_lang)
+        log.info("Required packages: %s", required_packages)
         
         success_count = 0
         for source, target in required_packages:
             if self.install_package(source, target):
                 success_count += 1
             else:
-                print(f"Failed to install {source} → {target}")
+                log.error("Failed to install %s → %s", source, target)
         
         success = success_count == len(required_packages)
         if success:
-            print(f"Successfully installed all packages for {from_lang} → {to_lang}")
+            log.info("Successfully installed all packages for %s → %s", from_lang, to_lang)
         else:
-            print(f"Failed to install {len(required_packages) - success_count} packages")
+            log.error("Failed to install %s packages", len(required_packages) - success_count)
         
         return success
     
+    def _get_translator(self, from_lang: str, to_lang: str) -> Callable[[str], str]:
+        """Resolve the installed argos translation for a single package once and reuse it"""
+        key = (from_lang, to_lang)
+        translator = self._translator_cache.get(key)
+        if translator is None:
+            languages = {lang.code: lang for lang in argostranslate.translate.get_installed_languages()}
+            translation = languages[from_lang].get_translation(languages[to_lang])
+            if translation is None:
+                raise ValueError(f"No installed translation from {from_lang} to {to_lang}")
+            translator = self._translator_cache[key] = translation.translate
+        return translator
+    
     def translate(self, text: str, from_lang: str, to_lang: str) -> str:
         """Translate text using direct or pivot translation"""
         try:
-            if not text.strip() or from_lang == to_lang:
+            # Empty, whitespace-only and single-character OCR noise is not worth a model call
+            if from_lang == to_lang or len(text) < 2 or text.isspace():
                 return text
             
-            path = self.find_translation_path(from_lang, to_lang)
-            if len(path) < 2:
-                print(f"No translation path available from {from_lang} to {to_lang}")
-                return text
+            key = (text, from_lang, to_lang)
+            with self._recent_translations_lock:
+                if key in self._recent_translations:
+                    self._recent_translations.move_to_end(key)
+                    return self._recent_translations[key]
             
-            if len(path) == 2:
-                # Direct translation
-                translated = argostranslate.translate.translate(text, from_lang, to_lang)
-                print(f"Direct translation: '{text}' ({from_lang}) → '{translated}' ({to_lang})")
-                return translated
-            else:
-                # Pivot translation
-                current_text = text
-                print(f"Using pivot translation: {' → '.join(path)}")
-                
-                for i in range(len(path) - 1):
-                    source = path[i]
-                    target = path[i + 1]
-                    prev_text = current_text
-                    current_text = argostranslate.translate.translate(current_text, source, target)
-                    print(f"Step {i+1}: '{prev_text}' ({source}) → '{current_text}' ({target})")
-                
-                print(f"Final result: '{text}' ({from_lang}) → '{current_text}' ({to_lang})")
-                return current_text
+            translated = self._translate(text, from_lang, to_lang)
+            
+            with self._recent_translations_lock:
+                self._recent_translations[key] = translated
+                if len(self._recent_translations) > self._recent_translations_size:
+                    self._recent_translations.popitem(last=False)
+            return translated
             
         except Exception as e:
-            print(f"Translation error: {e}")
+            log.error("Translation error: %s", e)
             return text
+    
+    def _with_retry(self, func: Callable, *args):
+        """Call func, retrying transient errors with jittered exponential backoff"""
+        for attempt in range(self._retry_attempts):
+            try:
+                return func(*args)
+            except TRANSIENT_ERRORS as e:
+                if attempt == self._retry_attempts - 1:
+                    raise
+                # Jitter keeps concurrent callers from retrying in lockstep
+                delay = self._retry_base_delay * (2 ** attempt) * random.uniform(0.75, 1.25)
+                log.warning("Transient error (%s), retrying in %.2fs", e, delay)
+                time.sleep(delay)
+    
+    def _build_pipeline(self, from_lang: str, to_lang: str) -> Optional[Callable[[str], str]]:
+        """Compose the translators along the path into a single callable"""
+        path = self.find_translation_path(from_lang, to_lang)
+        if len(path) < 2:
+            return None
+        
+        translators = tuple(self._get_translator(source, target) for source, target in zip(path, path[1:]))
+        if len(translators) == 1:
+            # Direct translation
+            pipeline = translators[0]
+        else:
+            # Pivot translation
+            log.debug("Using pivot translation: %s", ' → '.join(path))
+            pipeline = lambda text: reduce(lambda acc, translate: translate(acc), translators, text)
+        
+        self._pipeline_cache[(from_lang, to_lang)] = pipeline
+        return pipeline
+    
+    def _run_bounded(self, pipeline: Callable[[str], str], text: str) -> str:
+        """One translation attempt, holding a concurrency slot only while the models run"""
+        with self._translate_sem:
+            return pipeline(text)
+    
+    def _translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """Run the argos models along the translation path"""
+        pipeline = self._pipeline_cache.get((from_lang, to_lang)) or self._build_pipeline(from_lang, to_lang)
+        if pipeline is None:
+            log.debug("No translation path available from %s to %s", from_lang, to_lang)
+            return text
+        
+        # The slot is taken per attempt, so backoff sleeps don't hold it
+        translated = self._with_retry(self._run_bounded, pipeline, text)
+        log.debug("Translation: '%s' (%s) → '%s' (%s)", text, from_lang, translated, to_lang)
+        return translated
 
 class OCRService:
-    def __init__(self):
-        self.sct = mss.mss()
-        self.temp_image_path = os.path.join(tempfile.gettempdir(), 'ocr_screenshot-polyglot.png')
+    def __init__(self, downscale: bool = True):
+        # Single mss instance for the service lifetime so backends can keep their capture resources alive;
+        # reopened on the next capture if cleanup() closed it
+        self.sct: Optional[mss.base.MSSBase] = mss.mss()
+        self._monitor: Optional[dict] = None
+        self._region_key: Optional[Tuple[int, int, int, int]] = None
         
         # Check if we're on macOS and ocrmac is available
         if not OCRMAC_AVAILABLE or platform.system() != "Darwin":
             raise RuntimeError("ocrmac is only available on macOS. Please install with: pip install ocrmac")
         
-        print("Using ocrmac (Apple Vision Framework) for OCR")
+        log.info("Using ocrmac (Apple Vision Framework) for OCR")
+        self.downscale = downscale
         self._setup_ocrmac()
         
-        # Current language setting
+        # Current language setting, plus the preference list handed to ocrmac on every frame
         self.current_language = 'en'
+        self._lang_pref = [self.current_language]
     
     def _setup_ocrmac(self):
-        """Setup ocrmac with language mappings"""
-        # Map common language codes to IANA language tags for ocrmac
-        self.language_codes = {
-            'en': 'en-US',      # English
-            'es': 'es-ES',      # Spanish  
-            'fr': 'fr-FR',      # French
-            'de': 'de-DE',      # German
-            'it': 'it-IT',      # Italian
-            'pt': 'pt-PT',      # Portuguese
-            'ru': 'ru-RU',      # Russian
-            'ja': 'ja-JP',      # Japanese
-            'ko': 'ko-KR',      # Korean
-            'zh': 'zh-Hans',    # Chinese (Simplified)
-            'ar': 'ar-SA',      # Arabic
-            'hi': 'hi-IN',      # Hindi
-            'nl': 'nl-NL',      # Dutch
-            'sv': 'sv-SE',      # Swedish
-            'da': 'da-DK',      # Danish
-            'no': 'no-NO',      # Norwegian
-            'fi': 'fi-FI',      # Finnish
-            'pl': 'pl-PL',      # Polish
-            'cs': 'cs-CZ',      # Czech
-            'sk': 'sk-SK',      # Slovak
-        }
-        
+        """Setup ocrmac settings"""
         # OCR settings
         self.recognition_level = 'accurate'  # 'fast' or 'accurate'
         self.use_livetext = True  # Try LiveText first (macOS Sonoma+)
+        
+        # Tall regions are shrunk towards two lines of this height (at most 2x) before OCR,
+        # Vision gains nothing from extra pixels at subtitle font sizes
+        self.target_line_height = 40
+        self.min_scale = 0.5
+        
+        # Conversion targets, reused across frames and reallocated only when the size changes.
+        # Only the OCR stage touches them, so a frame in flight is never overwritten.
+        self._scaled_buf: Optional[np.ndarray] = None
+        self._rgb_buf: Optional[np.ndarray] = None
     
     def set_language(self, language_code: str):
         """Set the OCR language"""
-        self.current_language = self.language_codes.get(language_code)
-        print(f"OCR language set to: {language_code} -> {self.current_language}")
+        self.current_language = LANGUAGE_CODES.get(language_code)
+        self._lang_pref = [self.current_language]
+        log.info("OCR language set to: %s -> %s", language_code, self.current_language)
     
     def capture_and_recognize(self, region: Region) -> str:
+        screenshot = self.capture(region)
+        return self.recognize(screenshot) if screenshot is not None else ""
+    
+    def capture(self, region: Region) -> Optional[mss.screenshot.ScreenShot]:
+        """Grab the screen region"""
         try:
-            # Capture screen region
-            monitor_area = {
-                "top": region.y,
-                "left": region.x,
-                "width": region.width,
-                "height": region.height
-            }
-            screenshot = self.sct.grab(monitor_area)
+            # Rebuild the monitor area only when the region changes
+            region_key = (region.x, region.y, region.width, region.height)
+            if region_key != self._region_key:
+                self._region_key = region_key
+                self._monitor = {
+                    "top": region.y,
+                    "left": region.x,
+                    "width": region.width,
+                    "height": region.height
+                }
             
-            # Convert screenshot to numpy array directly
-            img_array = np.frombuffer(screenshot.bgra, dtype=np.uint8)
-            img_array = img_array.reshape((screenshot.height, screenshot.width, 4))
+            # Capture screen region
+            if self.sct is None:
+                self.sct = mss.mss()
+            return self.sct.grab(self._monitor)
             
-            # Convert BGRA to RGB (remove alpha channel and swap B/R channels)
-            img_rgb = img_array[:, :, [2, 1, 0]]  # BGRA -> RGB
-            imageio.imwrite(self.temp_image_path, img_rgb)
-            print(self.current_language)
+        except Exception as e:
+            log.error("Capture error: %s", e)
+            return None
+    
+    def _to_image(self, screenshot: mss.screenshot.ScreenShot) -> Image.Image:
+        """Convert a BGRA screenshot to an RGB image, reusing the conversion buffer"""
+        # Zero-copy view over the raw BGRA buffer (screenshot.bgra would copy it)
+        img_array = np.frombuffer(screenshot.raw, dtype=np.uint8)
+        img_array = img_array.reshape((screenshot.height, screenshot.width, 4))
+        height, width = screenshot.height, screenshot.width
+        
+        # Downscale before the color conversion so it runs on fewer pixels
+        max_height = 2 * self.target_line_height
+        if self.downscale and height > max_height:
+            scale = max(max_height / height, self.min_scale)
+            height, width = max(1, round(height * scale)), max(1, round(width * scale))
+            if self._scaled_buf is None or self._scaled_buf.shape != (height, width, 4):
+                self._scaled_buf = np.empty((height, width, 4), dtype=np.uint8)
+            cv2.resize(img_array, (width, height), dst=self._scaled_buf, interpolation=cv2.INTER_AREA)
+            img_array = self._scaled_buf
+        
+        shape = (height, width, 3)
+        if self._rgb_buf is None or self._rgb_buf.shape != shape:
+            self._rgb_buf = np.empty(shape, dtype=np.uint8)
+        
+        # Convert BGRA to RGB (remove alpha channel and swap B/R channels)
+        cv2.cvtColor(img_array, cv2.COLOR_BGRA2RGB, dst=self._rgb_buf)
+        
+        # Hand ocrmac an in-memory image instead of a PNG round-trip through disk.
+        # Built per frame: Pillow only shares memory for RGBA/RGBX-like modes,
+        # so an 'RGB' image made once would be a stale snapshot of the buffer.
+        return Image.fromarray(self._rgb_buf)
+    
+    def recognize(self, screenshot: mss.screenshot.ScreenShot) -> str:
+        """Run OCR on a captured screenshot"""
+        try:
+            image = self._to_image(screenshot)
             # Try LiveText first (more accurate on newer macOS)
             if self.use_livetext:
                 try:
                     annotations = ocrmac.livetext_from_image(
-                        self.temp_image_path,
-                        language_preference=[self.current_language]
+                        image,
+                        language_preference=self._lang_pref
                     )
                     
                     # Extract text from annotations
@@ -489,13 +736,13 @@ class OCRService:
                         if result.strip():
                             return self._clean_ocr_text(result)
                 except Exception as e:
-                    print(f"LiveText failed, falling back to Vision Framework: {e}")
+                    log.debug("LiveText failed, falling back to Vision Framework: %s", e)
             
             # Fallback to regular Vision Framework
             ocr_instance = ocrmac.OCR(
-                self.temp_image_path,
+                image,
                 recognition_level=self.recognition_level,
-                language_preference=[self.current_language]
+                language_preference=self._lang_pref
             )
             
             annotations = ocr_instance.recognize()
@@ -509,7 +756,7 @@ class OCRService:
             return ""
             
         except Exception as e:
-            print(f"OCR error: {e}")
+            log.error("OCR error: %s", e)
             return ""
     
     def _clean_ocr_text(self, text: str) -> str:
@@ -517,30 +764,18 @@ class OCRService:
         if not text:
             return ""
         
-        # Remove extra whitespace and normalize newlines
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove leading/trailing whitespace
-            line = line.strip()
-            if line:  # Only keep non-empty lines
-                # Normalize internal whitespace
-                line = ' '.join(line.split())
-                cleaned_lines.append(line)
-        
-        # Join lines with spaces for subtitle-like output
-        result = ' '.join(cleaned_lines)
-        
-        # Only return if we have substantial text (at least 1 character for non-Latin scripts)
-        return result if len(result.strip()) > 0 else ""
+        # Collapse newlines and runs of whitespace into single spaces in one pass,
+        # joining lines for subtitle-like output
+        return WHITESPACE_RE.sub(' ', text).strip()
     
     def cleanup(self):
+        sct, self.sct = self.sct, None
+        if sct is None:
+            return
         try:
-            if os.path.exists(self.temp_image_path):
-                os.remove(self.temp_image_path)
-        except:
-            pass
+            sct.close()
+        except Exception:
+            log.debug("Error closing screen capture", exc_info=True)
 
 # ============================================================================
 # BUSINESS LOGIC CONTROLLER (Keep existing controller unchanged)
@@ -552,20 +787,42 @@ class OCRController(Observable):
         self.state = AppState()
         
         # Services
-        self.region_service = RegionSelectionService()
-        self.translation_service = TranslationService()
+        self.region_service = RegionSelectionService(reclaim=True)
+        self.translation_service = TranslationService(
+            on_packages_loaded=lambda: self.notify_observers("packages_loaded", None)
+        )
         self.ocr_service = OCRService()
         
         # Runtime state
-        self.is_running = False
-        self.capture_thread: Optional[threading.Thread] = None
-        self.last_processed_text = ""
+        self.is_running: bool = False
+        # Set to stop the pipeline; waits on it return as soon as stop_capture() fires
+        self._stop_event = threading.Event()
+        self.workers: List[threading.Thread] = []
+        self._cached_path: list = []
+        self._cached_can_translate = False
+        self._refresh_translation_path()
+        
+        # UI status lookups keyed on the settings and an installed-packages version counter
+        self._pkgs_version = 0
+        self._translation_info = lru_cache(maxsize=32)(self._compute_translation_info)
+        self.last_processed_text: str = ""
+        self.last_processed_hash: int = hash("")
+        
+        # Capture interval backs off while the text is static and snaps back when it changes
+        self.min_capture_interval: float = 0.1
+        self.max_capture_interval: float = 1.0
+        self.capture_interval: float = self.min_capture_interval
+        self.last_frame_hash: Optional[int] = None
+        
+        # Pipeline stages hand over only the most recent item (capture -> OCR -> translation)
+        self.frame_queue: queue.Queue = queue.Queue(maxsize=1)
+        self.text_queue: queue.Queue = queue.Queue(maxsize=1)
         
     def set_region(self, region: Region):
         """Set the capture region"""
         self.state.region = region
         self.notify_observers("region_changed", region)
-        print(f"Region set: {region}")
+        log.debug("Region set: %s", region)
     
     def set_translation_settings(self, settings: TranslationSettings):
         """Update translation settings"""
@@ -573,28 +830,37 @@ class OCRController(Observable):
         
         # Update OCR language to match source language
         self.ocr_service.set_language(settings.source_language)
+        self._refresh_translation_path()
         
         self.notify_observers("translation_settings_changed", settings)
-        print(f"Translation settings: {settings}")
+        log.debug("Translation settings: %s", settings)
+    
+    def _refresh_translation_path(self):
+        """Resolve the installed path for the current language pair once, not per subtitle"""
+        settings = self.state.translation_settings
+        self._cached_path = self.translation_service.find_translation_path(
+            settings.source_language,
+            settings.target_language
+        )
+        self._cached_can_translate = len(self._cached_path) >= 2
     
     def check_translation_package(self) -> bool:
         """Check if current translation package is available"""
-        settings = self.state.translation_settings
-        if not settings.enabled:
+        if not self.state.translation_settings.enabled:
             return True
         
-        return self.translation_service.can_translate(
-            settings.source_language, 
-            settings.target_language
-        )
+        return self._cached_can_translate
         
     def install_translation_package(self) -> bool:
         """Install required translation packages for pivot translation"""
         settings = self.state.translation_settings
-        return self.translation_service.install_translation_path(
+        success = self.translation_service.install_translation_path(
             settings.source_language,
             settings.target_language
         )
+        self._pkgs_version += 1
+        self._refresh_translation_path()
+        return success
     
     def start_capture(self):
         """Start OCR capture process"""
@@ -607,8 +873,18 @@ class OCRController(Observable):
         
         self.is_running = True
         self.state.is_running = True
-        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
-        self.capture_thread.start()
+        self._stop_event.clear()
+        self._drain(self.frame_queue)
+        self._drain(self.text_queue)
+        self.capture_interval = self.min_capture_interval
+        self.last_frame_hash = None
+        
+        self.workers = [
+            threading.Thread(target=stage, daemon=True)
+            for stage in (self._capture_loop, self._ocr_loop, self._translation_loop)
+        ]
+        for thread in self.workers:
+            thread.start()
         
         self._update_status("Running OCR and translation...", "green")
         self.notify_observers("capture_started", None)
@@ -617,41 +893,124 @@ class OCRController(Observable):
         """Stop OCR capture process"""
         self.is_running = False
         self.state.is_running = False
+        self._stop_event.set()
+        # Wake stages blocked on an empty queue so they see the stop right away
+        self._put_latest(self.frame_queue, None)
+        self._put_latest(self.text_queue, None)
         
-        if self.capture_thread:
-            self.capture_thread.join(timeout=2)
+        for thread in self.workers:
+            thread.join(timeout=2)
+        self.workers = []
         
         self._update_status("Stopped", "orange")
         self.notify_observers("capture_stopped", None)
     
+    @staticmethod
+    def _put_latest(q: queue.Queue, item: Any):
+        """Put item on a bounded queue, dropping the stale entry if it is full"""
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            pass
+    
+    @staticmethod
+    def _drain(q: queue.Queue):
+        """Discard anything left over from a previous run"""
+        try:
+            while True:
+                q.get_nowait()
+        except queue.Empty:
+            pass
+    
     def _capture_loop(self):
-        """Main capture and processing loop"""
-        while self.is_running and self.state.region:
+        """Capture stage: grab the region and hand the latest frame to OCR"""
+        # Bind per-frame lookups once; these don't change while the pipeline runs
+        state = self.state
+        capture = self.ocr_service.capture
+        stopped = self._stop_event.is_set
+        wait = self._stop_event.wait
+        put_latest = self._put_latest
+        frame_queue = self.frame_queue
+        crc32 = zlib.crc32
+        
+        while not stopped() and state.region:
             try:
-                # Capture and OCR
-                raw_text = self.ocr_service.capture_and_recognize(self.state.region)
+                screenshot = capture(state.region)
+                if screenshot is not None:
+                    # Identical pixels can't produce new text, so skip OCR for them entirely
+                    frame_hash = crc32(screenshot.raw)
+                    if frame_hash != self.last_frame_hash:
+                        self.last_frame_hash = frame_hash
+                        put_latest(frame_queue, screenshot)
+                    else:
+                        self.capture_interval = min(self.max_capture_interval, self.capture_interval * 1.5)
+                
+                if wait(self.capture_interval):
+                    break
+                
+            except Exception:
+                log.exception("Capture loop error")
+                if wait(1):
+                    break
+    
+    def _ocr_loop(self):
+        """OCR stage: recognize the latest frame and forward new text"""
+        while not self._stop_event.is_set():
+            try:
+                screenshot = self.frame_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if screenshot is None:
+                continue
+            
+            try:
+                raw_text = self.ocr_service.recognize(screenshot)
+                
+                # Compare digests first; equal digests still get a full compare to rule out collisions
+                text_hash = hash(raw_text)
+                is_duplicate = text_hash == self.last_processed_hash and raw_text == self.last_processed_text
                 
-                if raw_text and raw_text != self.last_processed_text:
+                if raw_text and not is_duplicate:
                     self.last_processed_text = raw_text
+                    self.last_processed_hash = text_hash
+                    self._put_latest(self.text_queue, raw_text)
+                    self.capture_interval = self.min_capture_interval
+                else:
+                    self.capture_interval = min(self.max_capture_interval, self.capture_interval * 1.5)
                     
-                    # Process translation
-                    subtitle_data = self._process_text(raw_text)
-                    
-                    # Update state and notify
-                    self.state.current_subtitle = subtitle_data
-                    self.notify_observers("subtitle_updated", subtitle_data)
+            except Exception:
+                log.exception("OCR loop error")
+    
+    def _translation_loop(self):
+        """Translation stage: translate the latest text and publish it"""
+        while not self._stop_event.is_set():
+            try:
+                raw_text = self.text_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if raw_text is None:
+                continue
+            
+            try:
+                # Process translation
+                subtitle_data = self._process_text(raw_text)
                 
-                time.sleep(0.3)  # Capture interval
+                # Update state and notify
+                self.state.current_subtitle = subtitle_data
+                self.notify_observers("subtitle_updated", subtitle_data)
                 
-            except Exception as e:
-                print(f"Capture loop error: {e}")
-                time.sleep(1)
+            except Exception:
+                log.exception("Translation loop error")
     
     def _process_text(self, text: str) -> SubtitleData:
         """Process raw OCR text with translation"""
         settings = self.state.translation_settings
         
-        if settings.enabled and self.check_translation_package():
+        if settings.enabled and self._cached_can_translate:
             translated_text = self.translation_service.translate(
                 text, 
                 settings.source_language, 
@@ -683,22 +1042,37 @@ class OCRController(Observable):
     def get_translation_info(self) -> dict:
         """Get translation path information for UI display"""
         settings = self.state.translation_settings
-        if not settings.enabled:
+        return self._translation_info(
+            settings.enabled,
+            settings.source_language,
+            settings.target_language,
+            self.translation_service.packages_loaded,
+            self._pkgs_version
+        )
+    
+    def _compute_translation_info(self, enabled: bool, source_language: str, target_language: str,
+                                  packages_loaded: bool, pkgs_version: int) -> dict:
+        """Resolve the translation status; memoized per settings and package state"""
+        if not enabled:
             return {'status': 'disabled', 'message': 'Translation disabled'}
         
         # Check if currently possible
-        if self.translation_service.can_translate(settings.source_language, settings.target_language):
-            path = self.translation_service.find_translation_path(settings.source_language, settings.target_language)
+        path = self.translation_service.find_translation_path(source_language, target_language)
+        if len(path) >= 2:
             return {
                 'status': 'available',
                 'path': path,
                 'message': f'Ready: {" → ".join(path)}'
             }
         
+        # The package index is still being fetched
+        if not packages_loaded:
+            return {'status': 'loading', 'message': 'Loading translation packages...'}
+        
         # Check if possible with installation
-        if self.translation_service.can_translate_if_installed(settings.source_language, settings.target_language):
-            path = self.translation_service.find_available_translation_path(settings.source_language, settings.target_language)
-            required = self.translation_service.get_required_packages(settings.source_language, settings.target_language)
+        if self.translation_service.can_translate_if_installed(source_language, target_language):
+            path = self.translation_service.find_available_translation_path(source_language, target_language)
+            required = self.translation_service.get_required_packages(source_language, target_language)
             return {
                 'status': 'needs_install',
                 'path': path,
@@ -708,63 +1082,164 @@ class OCRController(Observable):
         
         return {
             'status': 'impossible',
-            'message': f'No translation available for {settings.source_language} → {settings.target_language}'
+            'message': f'No translation available for {source_language} → {target_language}'
         }
 
     def cleanup(self):
         """Cleanup resources"""
         self.stop_capture()
         self.ocr_service.cleanup()
-        self.region_service.clear_region()
+        self.region_service.close()
 
 
+class SharedSubtitle:
+    """
+    Latest subtitle in a fixed-size shared memory segment, guarded by a seqlock.
+    
+    The writer bumps the sequence number to odd before writing and back to even after;
+    readers retry if they saw an odd number or it changed while they were copying.
+    """
+    SHM_NAME = 'polyglot_subtitle'
+    SIZE = 8192
+    SEQ = struct.Struct('=Q')
+    # has_data, timestamp, confidence, source, target, is_translated, len(original), len(translated)
+    HEADER = struct.Struct('=?dd8s8s?II')
+    TEXT_OFFSET = SEQ.size + HEADER.size
+    # A write is a few hundred bytes; a sequence that stays odd this long means a dead writer
+    READ_RETRIES = 100
+    
+    def __init__(self, reclaim: bool = False):
+        self._shm, self._owner = open_shared_memory(self.SHM_NAME, self.SIZE, reclaim)
+        self._closed = False
+        self._last_seq = None
+        self._last_subtitle: Optional[SubtitleData] = None
+    
+    def _seq(self) -> int:
+        return self.SEQ.unpack_from(self._shm.buf, 0)[0]
+    
+    def write(self, subtitle_data: Optional[SubtitleData]):
+        # A capture thread can still publish while the app shuts down
+        if self._closed:
+            return
+        buf = self._shm.buf
+        # Start from even so a sequence left odd by a writer that died mid-write heals
+        seq = self._seq() & ~1
+        self.SEQ.pack_into(buf, 0, seq + 1)
+        
+        if subtitle_data:
+            original = subtitle_data.original_text.encode('utf-8')
+            translated = subtitle_data.translated_text.encode('utf-8')
+            # Truncate to fit; a multi-byte character cut in half is dropped on decode
+            capacity = self.SIZE - self.TEXT_OFFSET
+            if len(original) + len(translated) > capacity:
+                original = original[:capacity // 2]
+                translated = translated[:capacity - len(original)]
+            
+            self.HEADER.pack_into(
+                buf, self.SEQ.size, True,
+                subtitle_data.timestamp, subtitle_data.confidence,
+                subtitle_data.source_language.encode('utf-8'), subtitle_data.target_language.encode('utf-8'),
+                subtitle_data.is_translated, len(original), len(translated)
+            )
+            buf[self.TEXT_OFFSET:self.TEXT_OFFSET + len(original)] = original
+            buf[self.TEXT_OFFSET + len(original):self.TEXT_OFFSET + len(original) + len(translated)] = translated
+        else:
+            self.HEADER.pack_into(buf, self.SEQ.size, False, 0.0, 0.0, b'', b'', False, 0, 0)
+        
+        self.SEQ.pack_into(buf, 0, seq + 2)
+    
+    def read(self) -> Optional[SubtitleData]:
+        buf = self._shm.buf
+        for _ in range(self.READ_RETRIES):
+            seq = self._seq()
+            # Nothing new since the last read: a single 8-byte load
+            if seq == self._last_seq:
+                return self._last_subtitle
+            if seq % 2:
+                # Write in progress: let the writer run instead of spinning on the GIL
+                time.sleep(0)
+                continue
+            
+            (has_data, timestamp, confidence, source, target,
+             is_translated, len_original, len_translated) = self.HEADER.unpack_from(buf, self.SEQ.size)
+            original = bytes(buf[self.TEXT_OFFSET:self.TEXT_OFFSET + len_original])
+            translated = bytes(buf[self.TEXT_OFFSET + len_original:self.TEXT_OFFSET + len_original + len_translated])
+            
+            if self._seq() == seq:
+                break
+        else:
+            # No consistent snapshot; keep showing the last one and try again on the next wake-up
+            return self._last_subtitle
+        
+        subtitle_data = None
+        if has_data:
+            subtitle_data = SubtitleData(
+                original_text=original.decode('utf-8', errors='ignore'),
+                translated_text=translated.decode('utf-8', errors='ignore'),
+                is_translated=is_translated,
+                source_language=source.rstrip(b'\0').decode('utf-8'),
+                target_language=target.rstrip(b'\0').decode('utf-8'),
+                confidence=confidence,
+                timestamp=timestamp,
+            )
+        
+        self._last_seq = seq
+        self._last_subtitle = subtitle_data
+        return subtitle_data
+    
+    def close(self):
+        """Release the segment, removing it if this instance created it; safe to call twice"""
+        if self._closed:
+            return
+        self._closed = True
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
 class TranslationCommunicationService:
     """Service to handle communication between main app and detached translation window"""
     
-    def __init__(self):
+    def __init__(self, subtitle_event=None, window_closed_event=None, reclaim: bool = False):
         self.temp_dir = tempfile.gettempdir()
-        self.subtitle_file = os.path.join(self.temp_dir, 'ocr_current_subtitle.json')
         self.status_file = os.path.join(self.temp_dir, 'ocr_translation_status.json')
+        self._last_status_mtime_ns = 0
+        self._cached_status = False
+        # The main app reclaims a segment left over from a crash; the overlay attaches to it
+        self.shared_subtitle = SharedSubtitle(reclaim)
+        # Set on every publish; the detached window receives the main app's event when spawned
+        self.subtitle_event = subtitle_event or multiprocessing.Event()
+        # Set when the detached window goes away, so the main window can reattach without polling
+        self.window_closed_event = window_closed_event or multiprocessing.Event()
+        # Content of the last publish (timestamp excluded) so repeats don't wake the overlay
+        self._last_payload: Any = object()
         
     def save_subtitle(self, subtitle_data: Optional[SubtitleData]):
-        """Save current subtitle data to temp file"""
+        """Publish current subtitle data to the shared segment"""
+        payload = subtitle_data and (
+            subtitle_data.original_text, subtitle_data.translated_text, subtitle_data.is_translated,
+            subtitle_data.source_language, subtitle_data.target_language
+        )
+        if payload == self._last_payload:
+            return
         try:
-            if subtitle_data:
-                data = {
-                    'original_text': subtitle_data.original_text,
-                    'translated_text': subtitle_data.translated_text,
-                    'is_translated': subtitle_data.is_translated,
-                    'source_language': subtitle_data.source_language,
-                    'target_language': subtitle_data.target_language,
-                    'confidence': subtitle_data.confidence,
-                    'timestamp': subtitle_data.timestamp
-                }
-            else:
-                data = None
-                
-            with open(self.subtitle_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving subtitle: {e}")
+            self.shared_subtitle.write(subtitle_data)
+            self._last_payload = payload
+            self.subtitle_event.set()
+        except Exception:
+            log.exception("Error saving subtitle")
+    
+    def wait_for_update(self, timeout: float = 1.0) -> bool:
+        """Block until something was published or the timeout expires"""
+        updated = self.subtitle_event.wait(timeout)
+        self.subtitle_event.clear()
+        return updated
     
     def load_subtitle(self) -> Optional[SubtitleData]:
-        """Load current subtitle data from temp file"""
+        """Load current subtitle data from the shared segment"""
         try:
-            if os.path.exists(self.subtitle_file):
-                with open(self.subtitle_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if data:
-                        return SubtitleData(
-                            original_text=data['original_text'],
-                            translated_text=data['translated_text'],
-                            is_translated=data['is_translated'],
-                            source_language=data['source_language'],
-                            target_language=data['target_language'],
-                            confidence=data.get('confidence', 1.0),
-                            timestamp=data.get('timestamp', 0.0)
-                        )
-        except Exception as e:
-            print(f"Error loading subtitle: {e}")
+            return self.shared_subtitle.read()
+        except Exception:
+            log.exception("Error loading subtitle")
         return None
     
     def set_window_status(self, is_detached: bool):
@@ -774,30 +1249,42 @@ class TranslationCommunicationService:
                 'is_detached': is_detached,
                 'timestamp': time.time()
             }
-            with open(self.status_file, 'w') as f:
-                json.dump(status, f)
-        except Exception as e:
-            print(f"Error saving status: {e}")
+            # Write then rename so the overlay never reads a half-written document
+            tmp_file = self.status_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(dumps_json(status))
+            os.replace(tmp_file, self.status_file)
+            # Wake the detached window so it notices a reattach right away
+            self.subtitle_event.set()
+        except Exception:
+            log.exception("Error saving status")
     
     def get_window_status(self) -> bool:
         """Get the detached window status"""
         try:
-            if os.path.exists(self.status_file):
-                with open(self.status_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('is_detached', False)
-        except Exception as e:
-            print(f"Error loading status: {e}")
+            # A stat is far cheaper than open + parse, and the file only changes on detach/attach
+            mtime_ns = os.stat(self.status_file).st_mtime_ns
+            if mtime_ns == self._last_status_mtime_ns:
+                return self._cached_status
+            with open(self.status_file, 'rb') as f:
+                data = loads_json(f.read())
+            self._cached_status = data.get('is_detached', False)
+            self._last_status_mtime_ns = mtime_ns
+            return self._cached_status
+        except FileNotFoundError:
+            pass
+        except Exception:
+            log.exception("Error loading status")
         return False
     
     def cleanup(self):
-        """Clean up temp files"""
+        """Clean up temp files and shared memory"""
         try:
-            for file_path in [self.subtitle_file, self.status_file]:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-        except Exception as e:
-            print(f"Error cleaning up: {e}")
+            if os.path.exists(self.status_file):
+                os.remove(self.status_file)
+            self.shared_subtitle.close()
+        except Exception:
+            log.exception("Error cleaning up")
 
 # ============================================================================
 # REGION SELECTION UI (Keep existing region selector)
@@ -903,10 +1390,10 @@ def region_selection_screen(page: ft.Page):
         if width >= 20 and height >= 10:
             region = Region(int(left), int(top), int(width), int(height))
             region_service.save_region(region)
-            print(f"Region saved: {region}")
+            log.debug("Region saved: %s", region)
         else:
             region_service.save_region(None)
-            print("Region too small")
+            log.debug("Region too small")
         
         selector.is_selecting = False
         page.window.close()
@@ -934,26 +1421,50 @@ def region_selection_screen(page: ft.Page):
 # Helper functions for multi-page apps
 def start_page(sub_page_class):
     import flet
+    setup_logging()
     def APP(page: flet.Page):
         if sub_page_class.target:
-            sub_page_class.target(page)
+            sub_page_class.target(page, *sub_page_class.args)
         page.update()
     flet.app(target=APP, view=sub_page_class.view)
 
 class SubPage:
-    def __init__(self, target=None, view=ft.FLET_APP):
+    def __init__(self, target=None, view=ft.FLET_APP, args=()):
         self.target = target
         self.view = view
+        # Extra arguments for target, e.g. multiprocessing primitives shared with the sub page
+        self.args = args
+        self.process: Optional[multiprocessing.Process] = None
     
     def start(self):
-        multiprocessing.Process(target=start_page, args=[self]).start()
+        process = multiprocessing.Process(target=start_page, args=[self])
+        # Assigned after start(): self is pickled for the child and must not carry the handle
+        process.start()
+        self.process = process
+    
+    def join(self, timeout: Optional[float] = None):
+        """Block until the sub page process exits"""
+        if self.process:
+            self.process.join(timeout)
+    
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
 
 # ============================================================================
 # TRASLATION SCREEN (detached)
 # ============================================================================
 
-def translation_overlay_screen(page: ft.Page):
-    """Floating translation overlay window with file-based communication"""
+WAITING_FOR_TRANSLATION = "Waiting for translation..."
+
+@lru_cache(maxsize=64)
+def language_label(source_language: str, target_language: str, is_translated: bool) -> str:
+    """Language badge shown next to a subtitle, built once per language pair"""
+    if is_translated:
+        return f"{source_language.upper()} → {target_language.upper()}"
+    return f"Original ({source_language.upper()})"
+
+def translation_overlay_screen(page: ft.Page, subtitle_event=None, window_closed_event=None):
+    """Floating translation overlay window, woken by subtitle_event when the main app publishes"""
     page.title = "Translation Overlay"
     page.window.bgcolor = ft.Colors.TRANSPARENT
     page.bgcolor = ft.Colors.with_opacity(0.85, ft.Colors.BLACK)
@@ -968,11 +1479,11 @@ def translation_overlay_screen(page: ft.Page):
     page.window.height = 200
     
     # Communication service
-    comm_service = TranslationCommunicationService()
+    comm_service = TranslationCommunicationService(subtitle_event, window_closed_event)
     
     # Create the translation text widget
     translation_text = ft.Text(
-        "Waiting for translation...",
+        WAITING_FOR_TRANSLATION,
         color=ft.Colors.WHITE,
         size=16,
         weight=ft.FontWeight.W_500,
@@ -989,11 +1500,33 @@ def translation_overlay_screen(page: ft.Page):
     # Track last processed subtitle to avoid unnecessary updates
     last_timestamp = 0
     
+    # Back-to-back subtitles within one debounce window share a single page.update()
+    update_debounce = 0.05
+    pending_update: Optional[threading.Timer] = None
+    pending_lock = threading.Lock()
+    
     def on_close():
         """Close overlay and notify main window"""
         comm_service.set_window_status(False)
+        comm_service.window_closed_event.set()
         page.window.close()
     
+    def flush_update():
+        """Push the accumulated widget changes to the client"""
+        nonlocal pending_update
+        with pending_lock:
+            pending_update = None
+        page.update()
+    
+    def schedule_update():
+        """Request a page.update(), coalescing with one that is already pending"""
+        nonlocal pending_update
+        with pending_lock:
+            if pending_update is None:
+                pending_update = threading.Timer(update_debounce, flush_update)
+                pending_update.daemon = True
+                pending_update.start()
+    
     def update_translation_display():
         """Poll for subtitle updates and update display"""
         nonlocal last_timestamp
@@ -1007,27 +1540,29 @@ def translation_overlay_screen(page: ft.Page):
                 if subtitle_data.translated_text.strip():
                     translation_text.value = subtitle_data.translated_text
                     translation_text.color = ft.Colors.WHITE if subtitle_data.is_translated else ft.Colors.WHITE70
-                    if subtitle_data.is_translated:
-                        language_info.value = f"{subtitle_data.source_language.upper()} → {subtitle_data.target_language.upper()}"
-                    else:
-                        language_info.value = f"Original ({subtitle_data.source_language.upper()})"
+                    language_info.value = language_label(
+                        subtitle_data.source_language,
+                        subtitle_data.target_language,
+                        subtitle_data.is_translated
+                    )
                 else:
-                    translation_text.value = "Waiting for translation..."
+                    translation_text.value = WAITING_FOR_TRANSLATION
                     translation_text.color = ft.Colors.WHITE70
                     language_info.value = ""
                 
-                page.update()
+                schedule_update()
                 
-        except Exception as e:
-            print(f"Overlay update error: {e}")
+        except Exception:
+            log.exception("Overlay update error")
     
     def polling_loop():
-        """Main polling loop"""
+        """Main update loop"""
         while comm_service.get_window_status():  # Continue while window should be detached
+            # Sleeps until a subtitle (or status change) is published, with a periodic fallback
+            comm_service.wait_for_update(timeout=1.0)
             update_translation_display()
-            time.sleep(0.1)  # Poll every 100ms
         
-        print("Overlay polling stopped - window was reattached")
+        log.debug("Overlay polling stopped - window was reattached")
     
     # Set initial status
     comm_service.set_window_status(True)
@@ -1042,7 +1577,7 @@ def translation_overlay_screen(page: ft.Page):
     # Handle window close
     def on_window_event(e):
         if e.data == "close":
-            close_overlay()
+            on_close()
     
     page.on_window_event = on_window_event
     
@@ -1077,33 +1612,86 @@ def translation_overlay_screen(page: ft.Page):
 # MODERN UI USING FACTORY COMPONENTS
 # ============================================================================
 
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+@lru_cache(maxsize=None)
+def asset_base64(name: str) -> str:
+    """Read an asset once and keep it base64-encoded for inline ft.Image sources"""
+    with open(os.path.join(ASSETS_DIR, name), 'rb') as f:
+        return base64.b64encode(f.read()).decode('ascii')
+
+# Palette entries used by the state-change handlers, resolved once
+PRIMARY_COLOR = colors_map["primary"]
+SECONDARY_COLOR = colors_map["secondary"]
+TEXT_SECONDARY_COLOR = colors_map["text_secondary"]
+
+# Status chip styles; borders are immutable style records, safe to share between controls
+BORDER_PRIMARY = ft.border.all(1, PRIMARY_COLOR)
+BORDER_SUCCESS = ft.border.all(1, "#16a34a")
+BORDER_ERROR = ft.border.all(1, "#dc2626")
+BORDER_MUTED = ft.border.all(1, "#cbd5e1")
+SUCCESS_BG = "#dcfce7"
+ERROR_BG = "#fef2f2"
+MUTED_BG = "#f1f5f9"
+
+# Package status chip: kind -> (text color, background, border)
+STATUS_STYLES = MappingProxyType({
+    "ok": (PRIMARY_COLOR, SECONDARY_COLOR, BORDER_PRIMARY),
+    "success": ("#16a34a", SUCCESS_BG, BORDER_SUCCESS),
+    "error": ("#dc2626", ERROR_BG, BORDER_ERROR),
+    "muted": (ft.Colors.GREY_500, MUTED_BG, BORDER_MUTED),
+})
+
+# Region chip: state -> (background, border, text color)
+REGION_STYLES = MappingProxyType({
+    "selected": (SECONDARY_COLOR, BORDER_PRIMARY, TEXT_SECONDARY_COLOR),
+    "active": (SUCCESS_BG, BORDER_SUCCESS, "#16a34a"),
+    "stopped": (SECONDARY_COLOR, BORDER_PRIMARY, PRIMARY_COLOR),
+})
+
+# Language options for dropdowns, built once at import
+LANGUAGE_OPTIONS = (
+    FactoryDropdownOption("en", "English"),
+    FactoryDropdownOption("de", "German"),
+    FactoryDropdownOption("es", "Spanish"),
+    FactoryDropdownOption("fr", "French"),
+    FactoryDropdownOption("it", "Italian"),
+    FactoryDropdownOption("pt", "Portuguese"),
+    FactoryDropdownOption("ru", "Russian"),
+    FactoryDropdownOption("ja", "Japanese"),
+    FactoryDropdownOption("ko", "Korean"),
+    FactoryDropdownOption("zh", "Chinese"),
+    FactoryDropdownOption("ar", "Arabic"),
+    FactoryDropdownOption("hi", "Hindi"),
+)
+
 class ModernOCRUI(Observer):
     def __init__(self, page: ft.Page):
         self.page = page
         self.page.window.title_bar_hidden = True
         self.controller = OCRController()
-        self.controller.add_observer(self)
 
-        self.comm_service = TranslationCommunicationService()
+        self.comm_service = TranslationCommunicationService(reclaim=True)
         self.translation_detached = False
-        
-        # Language options for dropdowns
-        self.language_options = [
-            FactoryDropdownOption("en", "English"),
-            FactoryDropdownOption("de", "German"),
-            FactoryDropdownOption("es", "Spanish"),
-            FactoryDropdownOption("fr", "French"),
-            FactoryDropdownOption("it", "Italian"),
-            FactoryDropdownOption("pt", "Portuguese"),
-            FactoryDropdownOption("ru", "Russian"),
-            FactoryDropdownOption("ja", "Japanese"),
-            FactoryDropdownOption("ko", "Korean"),
-            FactoryDropdownOption("zh", "Chinese"),
-            FactoryDropdownOption("ar", "Arabic"),
-            FactoryDropdownOption("hi", "Hindi"),
-        ]
+        # Most recently detached overlay; closed-signals from older ones are ignored
+        self._overlay_page: Optional[SubPage] = None
+        
+        # Reused workers for short one-off background jobs (package installs)
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="polyglot-ui")
+        
+        # Subtitles arriving within one debounce window are rendered once, with the latest data
+        self._update_debounce = 0.08
+        self._update_timer: Optional[threading.Timer] = None
+        self._pending_subtitle: Optional[SubtitleData] = None
+        # Detach mode the pending render was keyed on (see _last_display)
+        self._pending_detached = False
+        self._update_lock = threading.Lock()
+        # What the widgets were last asked to show, including whether translation was detached
+        self._last_display: Optional[tuple] = None
         
         self._setup_ui()
+        # Register once the widgets exist, events (e.g. packages_loaded) may arrive from background threads
+        self.controller.add_observer(self)
         self._check_translation_package()
         self._start_status_monitoring()
     
@@ -1134,61 +1722,48 @@ class ModernOCRUI(Observer):
         
         # Header with app icon and title
         header = ft.Container(
-            content=ft.Column(
+            content=ft.Row(
                 [
-                    ft.Row(
+                    ft.Column(
                         [
-                            ft.Column(
+                            ft.Text(
+                                "Real time\nOCR + Translation",
+                                size=24,
+                                weight=ft.FontWeight.BOLD,
+                                color=colors_map["text_secondary"]
+                            ),
+                            ft.Row(
                                 [
-                                    ft.Column([
-                                        ft.Text(
-                                            "Real time",
-                                            size=24,
-                                            weight=ft.FontWeight.BOLD,
-                                            color=colors_map["text_secondary"]
-                                        ),
-                                        ft.Text(
-                                            "OCR + Translation",
-                                            size=24,
-                                            weight=ft.FontWeight.BOLD,
-                                            color=colors_map["text_secondary"]
+                                    ft.Container(
+                                        ft.Image(
+                                            src_base64=asset_base64("github-logo.svg"),
+                                            color=ft.Colors.BLACK12,
+                                            width=15,
+                                            height=15,
                                         ),
-                                    ], spacing=0),
-                                    ft.Row(
-                                        [
-                                            ft.Container(
-                                                ft.Image(
-                                                    src="github-logo.svg",
-                                                    color=ft.Colors.BLACK12,
-                                                    width=15,
-                                                    height=15,
-                                                ),
-                                                on_click=lambda e: self.page.launch_url("https://github.com/Bbalduzz/fletfactory")
-                                            ),
-                                            ft.Text(
-                                                "v.0.0.1",
-                                                size=12,
-                                                color=ft.Colors.BLACK12
-                                            ),
-                                        ],
-                                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                                    )
+                                        on_click=lambda e: self.page.launch_url("https://github.com/Bbalduzz/fletfactory")
+                                    ),
+                                    ft.Text(
+                                        "v.0.0.1",
+                                        size=12,
+                                        color=ft.Colors.BLACK12
+                                    ),
                                 ],
-                                spacing = 10
-                            ),
-                            ft.Container(expand=True),  # Spacer
-                            ft.Container(
-                                ft.Image(
-                                    src="logo.png",
-                                    width=100,
-                                    height=100,
-                                ),
-                                margin = ft.margin.only(bottom=20)
+                                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                             )
                         ],
+                        spacing = 10
                     ),
+                    ft.Container(expand=True),  # Spacer
+                    ft.Container(
+                        ft.Image(
+                            src_base64=asset_base64("logo.png"),
+                            width=100,
+                            height=100,
+                        ),
+                        margin = ft.margin.only(bottom=20)
+                    )
                 ],
-                spacing = 0
             ),
             margin=ft.margin.only(bottom=20, top=10),
         )
@@ -1242,13 +1817,13 @@ class ModernOCRUI(Observer):
         )
         
         self.source_dropdown = FactoryDropdown(
-            options=self.language_options,
+            options=list(LANGUAGE_OPTIONS),
             value="it",
             width=120,
         )
         
         self.target_dropdown = FactoryDropdown(
-            options=self.language_options,
+            options=list(LANGUAGE_OPTIONS),
             value="en",
             width=120,
         )
@@ -1330,36 +1905,30 @@ class ModernOCRUI(Observer):
 
         self.detach_btn = ft.Container(
             ft.Image(
-                src = "icons/square-arrow-out-up-right.svg",
+                src_base64 = asset_base64("icons/square-arrow-out-up-right.svg"),
                 width = 20,
                 height = 20,
             ),
             on_click=self._detach_translation
         )
 
-        self.attach_btn = ft.IconButton(
-            icon=ft.Icons.PICTURE_IN_PICTURE_ALT,
-            icon_color=colors_map["text_secondary"],
-            icon_size=20,
-            tooltip="Attach translation window",
-            on_click=self._attach_translation,
-            visible=False
-        )
-        
+        # Built on first detach, most sessions never leave the attached layout
+        self.attach_btn: Optional[ft.IconButton] = None
+        
+        self.translation_header = ft.Row([
+            ft.Text(
+                "Translated text",
+                size=14,
+                weight=ft.FontWeight.BOLD,
+                color=colors_map["text_secondary"]
+            ),
+            ft.Container(expand=True),
+            self.detach_btn
+        ])
         
         self.translated_text = ft.Container(
             content=ft.Column([
-                ft.Row([
-                    ft.Text(
-                        "Translated text",
-                        size=14,
-                        weight=ft.FontWeight.BOLD,
-                        color=colors_map["text_secondary"]
-                    ),
-                    ft.Container(expand=True),
-                    self.attach_btn,
-                    self.detach_btn
-                ]),
+                self.translation_header,
                 ft.Container(
                     content=self.translated_text_widget,  # Direct reference
                     height=100,
@@ -1437,44 +2006,70 @@ class ModernOCRUI(Observer):
             self._on_capture_started()
         elif event_type == "capture_stopped":
             self._on_capture_stopped()
+        elif event_type == "packages_loaded":
+            self._check_translation_package()
 
     def _start_status_monitoring(self):
-        """Start monitoring the detached window status"""
+        """Reattach the translation section whenever the detached window closes"""
         def monitor_status():
             while True:
+                # Sleeps until the overlay closes, no periodic wakeups
+                self.comm_service.window_closed_event.wait()
+                self.comm_service.window_closed_event.clear()
                 try:
-                    # Check if window was closed externally
-                    if self.translation_detached and not self.comm_service.get_window_status():
-                        # Window was closed, reattach
-                        self.translation_detached = False
-                        self.translated_text.visible = True
-                        self.detach_btn.visible = True
-                        self.attach_btn.visible = False
-                        
-                        # Update with current subtitle if available
-                        if self.controller.state.current_subtitle:
-                            self._update_subtitle_display(self.controller.state.current_subtitle)
-                        
-                        self.page.update()
-                        print("Translation window reattached automatically")
-                    
-                    time.sleep(0.5) 
-                except Exception as e:
-                    print(f"Status monitoring error: {e}")
-                    time.sleep(1)
+                    # A signal from an older overlay, or the current one closing but not yet
+                    # exited; its watcher sets the event again once the process is gone
+                    overlay_page = self._overlay_page
+                    if overlay_page is not None and overlay_page.is_alive():
+                        continue
+                    if self.translation_detached:
+                        self.page.run_thread(self._reattach_from_thread)
+                except Exception:
+                    log.exception("Status monitoring error")
         
         monitoring_thread = threading.Thread(target=monitor_status, daemon=True)
         monitoring_thread.start()
+    
+    def _reattach_from_thread(self):
+        """Show the translation section again after the overlay was closed externally"""
+        self.translation_detached = False
+        self.translated_text.visible = True
+        self.detach_btn.visible = True
+        if self.attach_btn:
+            self.attach_btn.visible = False
+        
+        # Update with current subtitle if available
+        if self.controller.state.current_subtitle:
+            self._update_subtitle_display(self.controller.state.current_subtitle)
+        
+        self.page.update()
+        log.debug("Translation window reattached automatically")
+    
+    def _build_attach_btn(self):
+        """Create the attach button and place it next to the detach button"""
+        self.attach_btn = ft.IconButton(
+            icon=ft.Icons.PICTURE_IN_PICTURE_ALT,
+            icon_color=TEXT_SECONDARY_COLOR,
+            icon_size=20,
+            tooltip="Attach translation window",
+            on_click=self._attach_translation,
+            visible=False
+        )
+        self.translation_header.controls.insert(
+            self.translation_header.controls.index(self.detach_btn), self.attach_btn
+        )
 
     def _detach_translation(self, e):
         """Detach translation section to a separate window"""
         if not self.translation_detached:
-            print("Detaching translation window...")
+            log.debug("Detaching translation window...")
             self.translation_detached = True
             
             # Hide the translated text section in main window
             self.translated_text.visible = False
             self.detach_btn.visible = False
+            if self.attach_btn is None:
+                self._build_attach_btn()
             self.attach_btn.visible = True
             
             # Save current subtitle to file
@@ -1482,16 +2077,31 @@ class ModernOCRUI(Observer):
                 self.comm_service.save_subtitle(self.controller.state.current_subtitle)
             
             # Create and start the overlay window
-            overlay_page = SubPage(target=translation_overlay_screen)
+            self.comm_service.window_closed_event.clear()
+            overlay_page = SubPage(
+                target=translation_overlay_screen,
+                args=(self.comm_service.subtitle_event, self.comm_service.window_closed_event)
+            )
             overlay_page.start()
+            self._overlay_page = overlay_page
+            
+            # The overlay signals a normal close itself; this also covers the process dying
+            def watch_overlay():
+                overlay_page.join()
+                # A newer overlay replaced this one (attach/detach meanwhile): not ours to report
+                if self._overlay_page is overlay_page:
+                    self.comm_service.window_closed_event.set()
+            
+            # Its own thread: join() blocks for the overlay's whole life and would pin a pool worker
+            threading.Thread(target=watch_overlay, daemon=True).start()
             
             self.page.update()
-            print("Translation window detached")
+            log.debug("Translation window detached")
     
     def _attach_translation(self, e):
         """Attach translation section back to main window"""
         if self.translation_detached:
-            print("Attaching translation window...")
+            log.debug("Attaching translation window...")
             self.translation_detached = False
             
             # Signal the detached window to close
@@ -1500,80 +2110,106 @@ class ModernOCRUI(Observer):
             # Show the translated text section in main window
             self.translated_text.visible = True
             self.detach_btn.visible = True
-            self.attach_btn.visible = False
+            if self.attach_btn:
+                self.attach_btn.visible = False
             
             # Update with current subtitle if available
             if self.controller.state.current_subtitle:
                 self._update_subtitle_display(self.controller.state.current_subtitle)
             
             self.page.update()
-            print("Translation window attached")
+            log.debug("Translation window attached")
     
     def _update_subtitle_display(self, subtitle_data: SubtitleData):
-        """Update subtitle display"""
-        try:
-            # Always save subtitle data for detached window
+        """Publish the subtitle and schedule a coalesced render"""
+        detached = self.translation_detached
+        if detached:
+            # Feed the detached window, which debounces on its own; _detach_translation primes it on open.
+            # Only the recognized text is shown here, so that is all the render depends on
             self.comm_service.save_subtitle(subtitle_data)
-            
+            display = (subtitle_data.original_text, None, None, True)
+        else:
+            display = (subtitle_data.original_text, subtitle_data.translated_text,
+                       subtitle_data.is_translated, False)
+        
+        # Static regions keep re-emitting the same text; detaching changes what gets rendered
+        if display == self._last_display:
+            return
+        self._last_display = display
+        
+        with self._update_lock:
+            self._pending_subtitle = subtitle_data
+            self._pending_detached = detached
+            if self._update_timer is None:
+                self._update_timer = threading.Timer(self._update_debounce, self._flush_updates)
+                self._update_timer.daemon = True
+                self._update_timer.start()
+    
+    def _flush_updates(self):
+        """Render the most recent pending subtitle"""
+        with self._update_lock:
+            subtitle_data = self._pending_subtitle
+            detached = self._pending_detached
+            self._update_timer = None
+        
+        try:
             # Update recognized text using direct widget reference
             if subtitle_data.original_text.strip():
                 self.recognized_text_widget.value = subtitle_data.original_text
-                self.recognized_text_widget.color = colors_map["text_secondary"]
+                self.recognized_text_widget.color = TEXT_SECONDARY_COLOR
             else:
                 self.recognized_text_widget.value = "Waiting for text..."
                 self.recognized_text_widget.color = ft.Colors.GREY_400
+            self.recognized_text_widget.update()
             
-            # Update translated text using direct widget reference (only if not detached)
-            if not self.translation_detached:
-                if subtitle_data.translated_text.strip():
-                    self.translated_text_widget.value = subtitle_data.translated_text
-                    self.translated_text_widget.color = colors_map["primary"] if subtitle_data.is_translated else colors_map["text_secondary"]
-                else:
-                    self.translated_text_widget.value = "Waiting for translation..."
-                    self.translated_text_widget.color = ft.Colors.GREY_400
+            # The translated widget is hidden while the overlay is detached. Use the mode the
+            # render was keyed on, not the current one: detaching inside the debounce window
+            # must still write the translation _last_display claims is on screen
+            if detached:
+                return
             
-            self.page.update()
+            if subtitle_data.translated_text.strip():
+                self.translated_text_widget.value = subtitle_data.translated_text
+                self.translated_text_widget.color = PRIMARY_COLOR if subtitle_data.is_translated else TEXT_SECONDARY_COLOR
+            else:
+                self.translated_text_widget.value = WAITING_FOR_TRANSLATION
+                self.translated_text_widget.color = ft.Colors.GREY_400
+            self.translated_text_widget.update()
             
-        except Exception as e:
-            print(f"Error updating subtitle display: {e}")
-            traceback.print_exc()
+        except Exception:
+            log.exception("Error updating subtitle display")
     
     def _update_status(self, status_data: Dict):
         """Update status message - could add a status indicator if needed"""
         pass
     
+    def _apply_region_state(self, state: str):
+        """Style the region chip from REGION_STYLES and push it"""
+        self.region_info.bgcolor, self.region_info.border, self.region_info.content.color = REGION_STYLES[state]
+        self.region_info.update()
+    
     def _update_region_info(self, region: Region):
         """Update region info display"""
         self.region_info.content.value = f"region: {region.width} x {region.height}"
-        self.region_info.bgcolor = colors_map["secondary"]
-        self.region_info.content.color = colors_map["text_secondary"]
-        self.region_info.border = ft.border.all(1, colors_map["primary"])
         self.start_btn.disabled = False
-        self.page.update()
+        self.start_btn.update()
+        self._apply_region_state("selected")
     
     def _on_capture_started(self):
         """Handle capture started event"""
         self.start_btn.disabled = True
         self.stop_btn.disabled = False
-        
-        # Update region info to show active state
-        self.region_info.bgcolor = "#dcfce7"  # Light green
-        self.region_info.border = ft.border.all(1, "#16a34a")  # Green border
-        self.region_info.content.color = "#16a34a"  # Green text
-        
-        self.page.update()
+        self.start_btn.update()
+        self.stop_btn.update()
+        self._apply_region_state("active")
     
     def _on_capture_stopped(self):
         """Handle capture stopped event"""
         self.start_btn.disabled = False
         self.stop_btn.disabled = True
-        
-        # Reset region info to normal state
-        self.region_info.bgcolor = colors_map["secondary"]
-        self.region_info.border = ft.border.all(1, colors_map["primary"])
-        self.region_info.content.color = colors_map["primary"]
-        
-        self.page.update()
+        self.start_btn.update()
+        self.stop_btn.update()
+        self._apply_region_state("stopped")
     
     def _select_region(self, e):
         """Handle region selection"""
@@ -1582,16 +2218,13 @@ class ModernOCRUI(Observer):
         region_page.start()
         
         def check_selection():
-            for i in range(300):  # 30 seconds timeout
-                time.sleep(0.1)
-                region = self.controller.region_service.load_region()
-                if region is not None:
-                    self.controller.set_region(region)
-                    return
-            
-            # Timeout - region selection cancelled
-            pass
+            # The selector closes its window on select or cancel, so its exit is the completion signal
+            region_page.join()
+            region = self.controller.region_service.load_region()
+            if region is not None:
+                self.controller.set_region(region)
         
+        # Own thread like watch_overlay: join() lasts as long as the selector window is open
         threading.Thread(target=check_selection, daemon=True).start()
     
     def _start_ocr(self, e):
@@ -1611,21 +2244,29 @@ class ModernOCRUI(Observer):
         )
         
         self.controller.set_translation_settings(settings)
-        self._check_translation_package()
+        # The page.update() below also carries the package status changes
+        self._check_translation_package(update=False)
         
         # Show/hide translation section based on enabled state
         self.translated_text.visible = settings.enabled
         self.page.update()
     
-    def _check_translation_package(self):
-        """Check translation package availability with pivot support"""
+    def _set_status(self, kind: str, text: str, update: bool = True):
+        """Show text in the package status chip using one of the STATUS_STYLES"""
+        text_color, bgcolor, border = STATUS_STYLES[kind]
+        self.package_status.content.value = text
+        self.package_status.content.color = text_color
+        self.package_status.bgcolor = bgcolor
+        self.package_status.border = border
+        if update:
+            self.package_status.update()
+    
+    def _check_translation_package(self, update: bool = True):
+        """Check translation package availability with pivot support; update=False leaves the flush to the caller"""
         settings = self.controller.state.translation_settings
         
         if not settings.enabled:
-            self.package_status.content.value = "Translation disabled"
-            self.package_status.content.color = ft.Colors.GREY_500
-            self.package_status.bgcolor = "#f1f5f9"
-            self.package_status.border = ft.border.all(1, "#cbd5e1")
+            self._set_status("muted", "Translation disabled", update)
             self.download_btn.visible = False
         else:
             # Get translation info
@@ -1634,29 +2275,14 @@ class ModernOCRUI(Observer):
             if info['status'] == 'available':
                 # Translation is ready
                 path = info['path']
-                if len(path) == 2:
-                    self.package_status.content.value = "✓ Direct"
-                else:
-                    self.package_status.content.value = f"✓ Via {path[1]}"
-                
-                self.package_status.content.color = colors_map["primary"]
-                self.package_status.bgcolor = colors_map["secondary"]
-                self.package_status.border = ft.border.all(1, colors_map["primary"])
+                self._set_status("ok", "✓ Direct" if len(path) == 2 else f"✓ Via {path[1]}", update)
                 self.download_btn.visible = False
                 
             elif info['status'] == 'needs_install':
                 # Translation possible but needs packages
                 required_count = len(info['required_packages'])
                 path = info['path']
-                
-                if len(path) == 2:
-                    self.package_status.content.value = f"⚠ Need direct package"
-                else:
-                    self.package_status.content.value = f"⚠ Need {required_count} packages"
-                
-                self.package_status.content.color = "#dc2626"
-                self.package_status.bgcolor = "#fef2f2"
-                self.package_status.border = ft.border.all(1, "#dc2626")
+                self._set_status("error", "⚠ Need direct package" if len(path) == 2 else f"⚠ Need {required_count} packages", update)
                 self.download_btn.visible = True
                 
                 # Update button text
@@ -1665,51 +2291,53 @@ class ModernOCRUI(Observer):
                 else:
                     self.download_btn.content.value = f"Download {required_count} models"
                     
+            elif info['status'] == 'loading':
+                self._set_status("muted", "⏳ Loading...", update)
+                self.download_btn.visible = False
+                
             else:  # impossible
-                self.package_status.content.value = "❌ Not available"
-                self.package_status.content.color = "#dc2626"
-                self.package_status.bgcolor = "#fef2f2"
-                self.package_status.border = ft.border.all(1, "#dc2626")
+                self._set_status("error", "❌ Not available", update)
                 self.download_btn.visible = False
         
-        self.page.update()
+        if update:
+            self.download_btn.update()
     
     def _install_package(self, e):
         """Install translation package"""
-        settings = self.controller.state.translation_settings
-        self.package_status.content.value = "📦 Installing..."
-        self.package_status.content.color = "#16a34a"
-        self.package_status.bgcolor = "#dcfce7"
-        self.package_status.border = ft.border.all(1, "#16a34a")
+        self._set_status("success", "📦 Installing...")
         self.download_btn.disabled = True
-        self.page.update()
+        self.download_btn.update()
         
         def install_in_background():
+            # Network and disk work only; the result is applied through Flet
             success = self.controller.install_translation_package()
-            if success:
-                self.package_status.content.value = "✓ Available"
-                self.package_status.content.color = "#16a34a"
-                self.package_status.bgcolor = "#dcfce7"
-                self.package_status.border = ft.border.all(1, "#16a34a")
-                self.download_btn.visible = False
-            else:
-                self.package_status.content.value = "❌ Failed"
-                self.package_status.content.color = "#dc2626"
-                self.package_status.bgcolor = "#fef2f2"
-                self.package_status.border = ft.border.all(1, "#dc2626")
-                self.download_btn.disabled = False
-            self.page.update()
+            self.page.run_thread(self._apply_install_result, success)
         
-        threading.Thread(target=install_in_background, daemon=True).start()
+        self._executor.submit(install_in_background)
+    
+    def _apply_install_result(self, success: bool):
+        """Reflect a finished package install in the status chip"""
+        if success:
+            self._set_status("success", "✓ Available")
+            self.download_btn.visible = False
+        else:
+            self._set_status("error", "❌ Failed")
+            self.download_btn.disabled = False
+        self.download_btn.update()
     
     def _on_window_close(self, e):
         """Handle main window close"""
+        # Registered as on_window_event, so it also sees focus, blur, resize and move
+        if e.data != "close":
+            return
         # Signal detached window to close
         self.comm_service.set_window_status(False)
         # Clean up temp files
         self.comm_service.cleanup()
         # Clean up controller
         self.controller.cleanup()
+        # Drop queued background jobs
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 # ============================================================================
@@ -1720,4 +2348,5 @@ def main(page: ft.Page):
     ui = ModernOCRUI(page)
 
 if __name__ == "__main__":
+    setup_logging()
     ft.app(target=main, assets_dir = "assets")
\ No newline at end of file
@@ -1,7 +1,59 @@
 import flet as ft
 from typing import List, Union, Callable, Optional
 from utils import colors_map
-import json, shutil
+import asyncio, json, logging, re, shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, replace
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+
+try:
+    import orjson
+    loads_json = orjson.loads
+except ImportError:
+    loads_json = json.loads
+
+# child of the app's "polyglot" logger, so it shares its handler and level
+log = logging.getLogger("polyglot.ui")
+
+class _SyntheticEvent:
+    """Minimal event passed to on_change callbacks of composite controls"""
+    __slots__ = ("control", "data")
+
+    def __init__(self, control, data):
+        self.control = control
+        self.data = data
+
+# Button styles are static, so every instance shares one ButtonStyle
+_FACTORY_BUTTON_STYLE = ft.ButtonStyle(
+    shape=ft.RoundedRectangleBorder(radius=6),
+    bgcolor={
+        ft.ControlState.DEFAULT: colors_map["primary"],
+        ft.ControlState.DISABLED: colors_map["secondary"],
+    },
+    color={
+        ft.ControlState.DEFAULT: colors_map["text_accent"],
+        ft.ControlState.DISABLED: colors_map["text_secondary"],
+    },
+    side=ft.BorderSide(
+        color=colors_map["primary"],
+        stroke_align=1,
+        width=1,
+    )
+)
+
+_FACTORY_SECONDARY_STYLE = ft.ButtonStyle(
+    shape=ft.RoundedRectangleBorder(radius=6),
+    bgcolor="#ffffff",
+    color=colors_map["text_secondary"],
+    overlay_color="#ffffff",
+    side=ft.BorderSide(
+        color=colors_map["border_normal"],
+        stroke_align=1,
+        width=1,
+    )
+)
 
 class FactoryButton(ft.TextButton):
     def __init__(self, content, on_click=None, **kwargs):
@@ -10,22 +62,7 @@ class FactoryButton(ft.TextButton):
             on_click=on_click,
             **kwargs
         )
-        self.style = ft.ButtonStyle(
-            shape=ft.RoundedRectangleBorder(radius=6),
-            bgcolor={
-                ft.ControlState.DEFAULT: colors_map["primary"],
-                ft.ControlState.DISABLED: colors_map["secondary"],
-            },
-            color={
-                ft.ControlState.DEFAULT: colors_map["text_accent"],
-                ft.ControlState.DISABLED: colors_map["text_secondary"],
-            },
-            side=ft.BorderSide(
-                color=colors_map["primary"],
-                stroke_align=1,
-                width=1,
-            )
-        )
+        self.style = _FACTORY_BUTTON_STYLE
 
 class FactorySecondaryButton(ft.TextButton):
     def __init__(self, content, on_click=None, **kwargs):
@@ -34,37 +71,30 @@ class FactorySecondaryButton(ft.TextButton):
             on_click=on_click,
             **kwargs
         )
-        self.style = ft.ButtonStyle(
-            shape=ft.RoundedRectangleBorder(radius=6),
-            bgcolor="#ffffff",
-            color=colors_map["text_secondary"],
-            overlay_color="#ffffff",
-            side=ft.BorderSide(
-                color=colors_map["border_normal"],
-                stroke_align=1,
-                width=1,
-            )
-        )
+        self.style = _FACTORY_SECONDARY_STYLE
+
+_DEFAULT_TEXT_STYLE = ft.TextStyle(
+    size=14,
+    color=colors_map["text_secondary"],
+)
+_TEXT_STYLE_FIELDS = tuple(f.name for f in fields(ft.TextStyle))
 
 class FactoryTextField(ft.TextField):
     def __init__(self, hint_text="", value="", height=40, **kwargs):
         height_param = {} if kwargs.get("multiline", False) else {"height": height}
-        default_text_style = ft.TextStyle(
-            size=14,
-            color=colors_map["text_secondary"],
-        )
         
         # If text_style is provided in kwargs, merge it with default
         if "text_style" in kwargs:
             custom_text_style = kwargs.pop("text_style")
-            # Create a dictionary from default text style
-            merged_style_dict = {k: v for k, v in default_text_style.__dict__.items() if v is not None}
-            # Update with custom style attributes
-            merged_style_dict.update({k: v for k, v in custom_text_style.__dict__.items() if v is not None})
-            # Create new TextStyle with merged attributes
-            text_style = ft.TextStyle(**merged_style_dict)
+            # Custom attributes that are set override the default ones
+            overrides = {}
+            for name in _TEXT_STYLE_FIELDS:
+                attr = getattr(custom_text_style, name)
+                if attr is not None:
+                    overrides[name] = attr
+            text_style = replace(_DEFAULT_TEXT_STYLE, **overrides)
         else:
-            text_style = default_text_style
+            text_style = _DEFAULT_TEXT_STYLE
 
         content_padding = kwargs.pop("content_padding", ft.padding.symmetric(horizontal=10, vertical=5))
 
@@ -86,40 +116,43 @@ class FactoryTextField(ft.TextField):
     def result(self):
         return self.content.value
 
+_CB_LABEL_STYLE = ft.TextStyle(
+    size=12,
+    color=colors_map["text_secondary"],
+)
+_CB_SHAPE = ft.ContinuousRectangleBorder(radius=8)
+_CB_FILL = {
+    ft.ControlState.HOVERED: colors_map["secondary"],
+    ft.ControlState.FOCUSED: colors_map["secondary"],
+    ft.ControlState.DEFAULT: "#ffffff",
+}
+_CB_BORDER_ACTIVE = ft.BorderSide(
+    color=colors_map["primary"],
+    stroke_align=1,
+    width=1,
+)
+_CB_BORDER_DEFAULT = ft.BorderSide(
+    color=colors_map["border_normal"],
+    stroke_align=1,
+    width=1,
+)
+_CB_BORDER_SIDE = {
+    ft.ControlState.HOVERED: _CB_BORDER_ACTIVE,
+    ft.ControlState.FOCUSED: _CB_BORDER_ACTIVE,
+    ft.ControlState.DEFAULT: _CB_BORDER_DEFAULT,
+}
+
 class FactoryCheckBox(ft.Checkbox):
     def __init__(self, label="", value=False, on_change=None, **kwargs):
         self._user_on_change = on_change
         super().__init__(
             label=label,
             value=value,
-            label_style=ft.TextStyle(
-                size=12,
-                color=colors_map["text_secondary"],
-            ),
-            shape=ft.ContinuousRectangleBorder(radius=8),
+            label_style=_CB_LABEL_STYLE,
+            shape=_CB_SHAPE,
             splash_radius=5.0,
-            fill_color={
-                ft.ControlState.HOVERED: colors_map["secondary"],
-                ft.ControlState.FOCUSED: colors_map["secondary"],
-                ft.ControlState.DEFAULT: "#ffffff",
-            },
-            border_side={
-                ft.ControlState.HOVERED: ft.BorderSide(
-                    color=colors_map["primary"],
-                    stroke_align=1,
-                    width=1,
-                ),
-                ft.ControlState.FOCUSED: ft.BorderSide(
-                    color=colors_map["primary"],
-                    stroke_align=1,
-                    width=1,
-                ),
-                ft.ControlState.DEFAULT: ft.BorderSide(
-                    color=colors_map["border_normal"],
-                    stroke_align=1,
-                    width=1,
-                ),
-            },
+            fill_color=_CB_FILL,
+            border_side=_CB_BORDER_SIDE,
             check_color=colors_map["primary"],
             on_change=self._handle_change,
             **kwargs
@@ -135,6 +168,20 @@ class FactoryCheckBox(ft.Checkbox):
     def result(self):
         return self.value
 
+_RADIO_LABEL_STYLE = ft.TextStyle(
+    size=12,
+    font_family="OpenRunde Regular",
+    color=colors_map["text_secondary"],
+)
+_RADIO_FILL = {
+    ft.ControlState.DEFAULT: colors_map["primary"],
+    ft.ControlState.DISABLED: colors_map["border_normal"],
+}
+_RADIO_OVERLAY = {
+    ft.ControlState.HOVERED: colors_map["secondary"],
+    ft.ControlState.FOCUSED: colors_map["secondary"],
+}
+
 class FactoryRadio(ft.Radio):
     def __init__(
         self, 
@@ -155,21 +202,11 @@ class FactoryRadio(ft.Radio):
             adaptive=adaptive,
             autofocus=autofocus,
             toggleable=toggleable,
-            label_style=ft.TextStyle(
-                size=12,
-                font_family="OpenRunde Regular",
-                color=colors_map["text_secondary"],
-            ),
-            fill_color={
-                ft.ControlState.DEFAULT: colors_map["primary"],
-                ft.ControlState.DISABLED: colors_map["border_normal"],
-            },
+            label_style=_RADIO_LABEL_STYLE,
+            fill_color=_RADIO_FILL,
             hover_color=colors_map["secondary"],
             focus_color=colors_map["secondary"],
-            overlay_color={
-                ft.ControlState.HOVERED: colors_map["secondary"],
-                ft.ControlState.FOCUSED: colors_map["secondary"],
-            },
+            overlay_color=_RADIO_OVERLAY,
             splash_radius=10.0,
             visual_density=ft.VisualDensity.STANDARD,
             **kwargs
@@ -179,17 +216,19 @@ class FactoryRadio(ft.Radio):
     def result(self):
         return self.value
 
+_DD_OPTION_STYLE = ft.TextStyle(
+    size=14,
+    color=colors_map["text_secondary"],
+)
+
 class FactoryDropdownOption(ft.DropdownOption):
     def __init__(self, key, text, **kwargs):
         super().__init__(
             key=key,
-            content=ft.Text(
-                value=text,
-                size=14,
-                color=colors_map["text_secondary"],
-            ),
+            content=ft.Text(value=text, style=_DD_OPTION_STYLE),
             **kwargs
         )
+
 class FactoryDropdown(ft.Dropdown):
     def __init__(self, options=None, value=None, hint_text="", enable_filter=False, **kwargs):
         super().__init__(
@@ -211,6 +250,16 @@ class FactoryDropdown(ft.Dropdown):
     def result(self):
         return self.value
 
+_FIELD_TITLE_STYLE = ft.TextStyle(
+    font_family="OpenRunde Medium",
+    size=14,
+    color=colors_map["text_secondary"],
+)
+_FIELD_HINT_STYLE = ft.TextStyle(
+    size=10,
+    color=ft.Colors.GREY_500,
+)
+
 class FactoryField(ft.Container):
     def __init__(self, title, hint_text, widget, **kwargs):
         super().__init__(**kwargs)
@@ -219,32 +268,26 @@ class FactoryField(ft.Container):
         self._title = title
         self._hint_text = hint_text
         self._widget = widget
+        controls = []
+        if self._title:
+            controls.append(ft.Text(self._title, style=_FIELD_TITLE_STYLE))
+        controls.append(self._widget)
+        if self._hint_text:
+            controls.append(ft.Text(self._hint_text, style=_FIELD_HINT_STYLE))
         self.content = ft.Column(
             spacing=10,
-            controls=[
-                *([] if not self._title else [
-                    ft.Text(
-                        self._title,
-                        style = ft.TextStyle(
-                            font_family="OpenRunde Medium",
-                            size=14,
-                            color=colors_map["text_secondary"],
-                        )
-                    ),
-                ]),
-                self._widget,
-                *([] if not self._hint_text else [
-                    ft.Text(
-                        self._hint_text,
-                        style = ft.TextStyle(
-                            size=10,
-                            color=ft.Colors.GREY_500,
-                        )
-                    )
-                ]),
-            ]
+            controls=controls
         )
 
+_BADGE_STYLE = ft.ButtonStyle(
+    color=colors_map["primary"],
+    bgcolor=colors_map["secondary"],
+    shape=ft.RoundedRectangleBorder(radius=6),
+)
+# (name, size, color) of the close icon; a control can't have two parents,
+# so each badge still gets its own Icon
+_BADGE_CLOSE_ICON = (ft.Icons.CLOSE, 12, colors_map["primary"])
+
 class FactoryBadge(ft.TextButton):
     def __init__(self, text, on_click=None, **kwargs):
         super().__init__(
@@ -253,30 +296,26 @@ class FactoryBadge(ft.TextButton):
         )
         self.expand = False
         self.text = text
-        self.style = ft.ButtonStyle(
-            color=colors_map["primary"],
-            bgcolor=colors_map["secondary"],
-            shape=ft.RoundedRectangleBorder(radius=6),
-        )
+        self.style = _BADGE_STYLE
         self.content=ft.Row(
             [
                 ft.Text(self.text),
-                ft.Icon(ft.Icons.CLOSE, size=12, color=colors_map["primary"])
+                ft.Icon(*_BADGE_CLOSE_ICON)
             ],
             expand=False,
             tight=True
         )
 
 class FactoryBadgeInput(ft.Container):
-    def __init__(self, hint_text="", value="", badges=[], on_change=None, **kwargs):
+    def __init__(self, hint_text="", value="", badges=None, on_change=None, **kwargs):
         super().__init__(**kwargs)
         self.bgcolor = "#ffffff"
         self.border = ft.border.all(1, colors_map["border_normal"])
         self.border_radius = 6
         self.padding = 5
         self.on_change = on_change
-        # Create a new list to avoid shared list issues
-        self._badges = badges.copy() if badges else []
+        # Own the list; the badges row aliases it, so mutate it in place
+        self._badges = list(badges) if badges else []
         self._text_field = FactoryTextField(
             hint_text=hint_text,
             value=value,
@@ -300,11 +339,7 @@ class FactoryBadgeInput(ft.Container):
         """Trigger the on_change event with the current badge values"""
         if self.on_change:
             # Create a synthetic event with the current badge values
-            e = type('obj', (object,), {
-                'control': self,
-                'data': self.value
-            })
-            self.on_change(e)
+            self.on_change(_SyntheticEvent(self, self.value))
 
     @property
     def value(self):
@@ -323,10 +358,7 @@ class FactoryBadgeInput(ft.Container):
                 badge = FactoryBadge(text=str(val), on_click=self.remove_badge)
                 self._badges.append(badge)
         
-        # Update the row's controls
-        self._badges_row.controls = self._badges
         self._badges_row.update()
-        self.update()
 
     @property
     def result(self):
@@ -334,34 +366,34 @@ class FactoryBadgeInput(ft.Container):
 
     def remove_badge(self, e):
         # Find the badge in the list and remove it
-        for badge in self._badges[:]:  # Create a copy to safely iterate
-            if badge == e.control:
-                self._badges.remove(badge)
-                # Update the row's controls directly
-                self._badges_row.controls = self._badges
-                print("removed badge", badge.text)
-                self._badges_row.update()
-                self.update()
-                # Trigger on_change event
-                self._trigger_on_change()
-                break
+        try:
+            i = self._badges.index(e.control)
+        except ValueError:
+            return
+        badge = self._badges.pop(i)
+        log.debug("removed badge %s", badge.text)
+        self._badges_row.update()
+        # Trigger on_change event
+        self._trigger_on_change()
 
     def on_submit(self, e):
         if e.data:
             # Create badge with removal function
             badge = FactoryBadge(text=e.data, on_click=self.remove_badge)
             self._badges.append(badge)
-            # Update the row's controls directly
-            self._badges_row.controls = self._badges
-            print("added badge", e.data)
+            log.debug("added badge %s", e.data)
             # Clear the text field
             self._text_field.value = ""
-            self._text_field.update()
-            self._badges_row.update()
             self.update()
             # Trigger on_change event
             self._trigger_on_change()
 
+_CARD_TITLE_STYLE = ft.TextStyle(
+    font_family="OpenRunde Semibold",
+    size=18,
+    color=colors_map["text_secondary"],
+)
+
 class FactoryCard(ft.Container):
     def __init__(self, title: ft.Text = "Title", content: List[FactoryField] = []):
         super().__init__(
@@ -377,14 +409,7 @@ class FactoryCard(ft.Container):
 
         self.content = ft.Column(
             controls=[
-                ft.Text(
-                    self._title, 
-                    style = ft.TextStyle(
-                        font_family="OpenRunde Semibold",
-                        size=18,
-                        color=colors_map["text_secondary"],
-                    )
-                ),
+                ft.Text(self._title, style=_CARD_TITLE_STYLE),
                 ft.Column(
                     spacing=20,
                     controls=self._content
@@ -397,15 +422,57 @@ class FactoryCard(ft.Container):
         
 
 ## platform section
+# indexed by PlatformButton.state: unselected, selected, disabled, hover
+_PLATFORM_STYLES = (
+    ft.ButtonStyle(
+        shape=ft.RoundedRectangleBorder(radius=6),
+        bgcolor="#ffffff",
+        color=colors_map["text_secondary"],
+        side=ft.BorderSide(
+            color=colors_map["border_normal"],
+            stroke_align=1,
+            width=1,
+        )
+    ),
+    ft.ButtonStyle(
+        shape=ft.RoundedRectangleBorder(radius=6),
+        bgcolor=colors_map["primary"],
+        color=colors_map["text_accent"],
+        side=ft.BorderSide(
+            color=colors_map["primary"],
+            stroke_align=1,
+            width=1,
+        )
+    ),
+    ft.ButtonStyle(
+        shape=ft.RoundedRectangleBorder(radius=6),
+        bgcolor="#e0e0e0",
+        color="#a0a0a0",
+        elevation=0
+    ),
+    ft.ButtonStyle(
+        shape=ft.RoundedRectangleBorder(radius=6),
+        bgcolor=colors_map["secondary"],
+        color=colors_map["text_secondary"],
+        side=ft.BorderSide(
+            color=colors_map["primary"],
+            stroke_align=1,
+            width=2,
+        ),
+    ),
+)
+
 class PlatformButton(ft.ElevatedButton):
     def __init__(self, platform, on_select=None):
         super().__init__(
             text=platform.value,
-            on_click=lambda e: self._handle_click(e, on_select),
+            on_click=self._handle_click,
             on_hover=self._on_hover
         )
+        self._on_select = on_select
         self.platform = platform
         self.state = 0  # 0 = unselected, 1 = selected, 2 = disabled, 3 = hover
+        self._last_style_key = None  # state whose style was last sent
         self.width = 120
         self.height = 40
 
@@ -413,55 +480,19 @@ class PlatformButton(ft.ElevatedButton):
         self._update_style()
 
     def _update_style(self):
-        if self.state == 0:  # unselected
-            self.style = ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=6),
-                bgcolor="#ffffff",
-                color=colors_map["text_secondary"],
-                side=ft.BorderSide(
-                    color=colors_map["border_normal"],
-                    stroke_align=1,
-                    width=1,
-                )
-            )
-        elif self.state == 1:  # selected
-            self.style = ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=6),
-                bgcolor=colors_map["primary"],
-                color=colors_map["text_accent"],
-                side=ft.BorderSide(
-                    color=colors_map["primary"],
-                    stroke_align=1,
-                    width=1,
-                )
-            )
-        elif self.state == 2:  # disabled
-            self.style = ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=6),
-                bgcolor="#e0e0e0",
-                color="#a0a0a0",
-                elevation=0
-            )
-        elif self.state == 3:  # hover
-            self.style = ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=6),
-                bgcolor=colors_map["secondary"],
-                color=colors_map["text_secondary"],
-                side=ft.BorderSide(
-                    color=colors_map["primary"],
-                    stroke_align=1,
-                    width=2,
-                ),
-            )
+        if self.state == self._last_style_key:
+            return
+        self.style = _PLATFORM_STYLES[self.state]
+        self._last_style_key = self.state
         self.update()
 
-    def _handle_click(self, e, on_select):
-        print("Clicked", self.platform.value)
+    def _handle_click(self, e):
+        log.debug("clicked %s", self.platform.value)
         if self.state != 2:  # if not disabled
             self.state = 1 if self.state == 0 else 0  # toggle between unselected and selected
             self._update_style()
-            if on_select:
-                on_select(self)
+            if self._on_select:
+                self._on_select(self)
 
     def _on_hover(self, e):
         prev_state = self.state
@@ -500,17 +531,19 @@ class PlatformsRow(ft.Row):
         self.buttons = []
         self.selected_button = None
         
-        # adding the scrollmode make the fisrt button overflow the row
-        # this is a workaround
-        self.controls.append(ft.Container(width=0))
+        buildable = (
+            buildable_platforms
+            if isinstance(buildable_platforms, (set, frozenset))
+            else frozenset(buildable_platforms)
+        )
+        on_select = self._handle_button_select
 
         # Create a button for each platform
         for platform in platforms:
-            button = PlatformButton(platform, on_select=self._handle_button_select)
+            button = PlatformButton(platform, on_select=on_select)
             self.buttons.append(button)
-            self.controls.append(button)
 
-            if platform not in buildable_platforms:
+            if platform not in buildable:
                 button.disable()
                 button.tooltip = ft.Tooltip(
                     message=f"Cannot build {platform.value} app on {current_os.capitalize()}",
@@ -518,8 +551,12 @@ class PlatformsRow(ft.Row):
                     
                 )
         
-        # same as before
-        self.controls.append(ft.Container(width=0))
+        # adding the scrollmode make the fisrt button overflow the row
+        # this is a workaround: pad both ends with empty containers
+        controls = [ft.Container(width=0)]
+        controls.extend(self.buttons)
+        controls.append(ft.Container(width=0))
+        self.controls = controls
     
     def _handle_button_select(self, button):
         if button == self.selected_button:
@@ -552,6 +589,7 @@ class IconPicker(ft.Container):
         self.hint_text = hint_text
         self.on_change = on_change
         self._value = ""
+        self._file_picker = None
         self.ref = ref
         self.content = self._build_content()
         self.padding = 0
@@ -595,19 +633,21 @@ class IconPicker(ft.Container):
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
     
+    def _on_file_dialog_result(self, e: ft.FilePickerResultEvent):
+        if e.files and len(e.files) > 0:
+            selected_file = e.files[0].path
+            self.value = selected_file
+            if self.on_change:
+                self.on_change(e)
+
     def _pick_file(self, e):
-        def on_dialog_result(e: ft.FilePickerResultEvent):
-            if e.files and len(e.files) > 0:
-                selected_file = e.files[0].path
-                self.value = selected_file
-                if self.on_change:
-                    self.on_change(e)
-                
-        file_picker = ft.FilePicker(on_result=on_dialog_result)
-        self.page.overlay.append(file_picker)
-        self.page.update()
+        # one picker per IconPicker, added to the page overlay on first use
+        if self._file_picker is None:
+            self._file_picker = ft.FilePicker(on_result=self._on_file_dialog_result)
+            self.page.overlay.append(self._file_picker)
+            self.page.update()
         # Only allow image files
-        file_picker.pick_files(
+        self._file_picker.pick_files(
             dialog_title=f"Select app icon file",
             allowed_extensions=["png", "jpg", "jpeg", "webp", "bmp", "gif"],
             allow_multiple=False,
@@ -663,16 +703,19 @@ class IconPicker(ft.Container):
         # All icon types to create
         icon_types = ["icon", "icon_ios", "icon_android", "icon_web", "icon_macos", "icon_windows"]
         
-        copied_files = []
+        # Read the source once and write every copy from memory
+        data = source_path.read_bytes()
         
-        # Copy the file with each icon type name
-        for icon_type in icon_types:
-            dest_filename = f"{icon_type}{ext}"
-            dest_path = assets_dir / dest_filename
-            
-            # Copy the file
-            shutil.copy2(source_path, dest_path)
-            copied_files.append(str(dest_path))
+        def write_copy(icon_type):
+            dest_path = assets_dir / f"{icon_type}{ext}"
+            dest_path.write_bytes(data)
+            # Keep copy2's behaviour of preserving timestamps and permissions
+            shutil.copystat(source_path, dest_path)
+            return str(dest_path)
+        
+        # The writes are independent I/O, so let them overlap
+        with ThreadPoolExecutor(max_workers=len(icon_types)) as executor:
+            copied_files = list(executor.map(write_copy, icon_types))
         
         return copied_files
 
@@ -710,6 +753,8 @@ class MultipleFactoryTextField(ft.Container):
         self.on_change = on_change
         self.hint_texts = hint_texts
         self.titles = titles
+        # value keys derived from the titles, computed once
+        self._keys = tuple(title.lower().replace(' ', '_') for title in titles)
         self.descriptions = descriptions
         self.ref = ref
         self._values = [""] * len(hint_texts)
@@ -745,42 +790,40 @@ class MultipleFactoryTextField(ft.Container):
         self._values[index] = e.control.value
         if self.on_change:
             # Create a synthetic event with all values
-            event = type('obj', (object,), {
-                'control': self,
-                'data': self.value
-            })
-            self.on_change(event)
+            self.on_change(_SyntheticEvent(self, self.value))
     
     @property
     def value(self):
         """Return a dictionary with the values from all fields"""
-        result = {}
-        for i, title in enumerate(self.titles):
-            key = title.lower().replace(' ', '_')
-            result[key] = self._values[i]
-        return result
+        return dict(zip(self._keys, self._values))
     
     @value.setter
     def value(self, val):
         """Set values from a dictionary or list"""
+        values = self._values
+        changed = False
         if isinstance(val, dict):
-            for i, title in enumerate(self.titles):
-                key = title.lower().replace(' ', '_')
-                if key in val:
-                    self._values[i] = val[key]
-                    if i < len(self.text_fields):
-                        self.text_fields[i].value = val[key]
+            for i, (key, text_field) in enumerate(zip(self._keys, self.text_fields)):
+                if key in val and val[key] != values[i]:
+                    values[i] = text_field.value = val[key]
+                    changed = True
         elif isinstance(val, list) and len(val) <= len(self.text_fields):
-            for i, v in enumerate(val):
-                self._values[i] = v
-                self.text_fields[i].value = v
-        self.update()
+            for i, (v, text_field) in enumerate(zip(val, self.text_fields)):
+                if v != values[i]:
+                    values[i] = text_field.value = v
+                    changed = True
+        # loading identical saved state needs no re-render
+        if changed:
+            self.update()
     
     @property
     def result(self):
         return self.value
 
 # MARK: Author
+# "John Doe (john@example.com)" -> ("John Doe", "john@example.com")
+_AUTHOR_RE = re.compile(r'^(.*?)\s*\(([^)]+)\)\s*$')
+
 class FactoryAuthorRow(ft.Row):
     def __init__(self, author: str = "", email: str = "", on_change: Optional[Callable] = None, ref: Optional[ft.Ref] = None):
         super().__init__(spacing=10)
@@ -788,6 +831,7 @@ class FactoryAuthorRow(ft.Row):
         self.email = email
         self.on_change = on_change
         self.ref = ref
+        self.author_field = self.email_field = None
         self.controls = self._build_content()
 
     def _build_content(self):
@@ -820,11 +864,7 @@ class FactoryAuthorRow(ft.Row):
     def _trigger_on_change(self):
         if self.on_change:
             # Create a synthetic event with the current values
-            e = type('obj', (object,), {
-                'control': self,
-                'data': self.value
-            })
-            self.on_change(e)
+            self.on_change(_SyntheticEvent(self, self.value))
     
     @property
     def value(self):
@@ -843,17 +883,16 @@ class FactoryAuthorRow(ft.Row):
         if isinstance(val, dict):
             self.author = val.get("name", "")
             self.email = val.get("email", "")
-        elif isinstance(val, str) and "(" in val and ")" in val:
+        elif isinstance(val, str) and (m := _AUTHOR_RE.match(val)):
             # Parse format like "John Doe (john@example.com)"
-            parts = val.split("(")
-            self.author = parts[0].strip()
-            self.email = parts[1].strip().rstrip(")")
+            self.author = m.group(1).strip()
+            self.email = m.group(2).strip()
         elif isinstance(val, list) and len(val) >= 2:
             self.author = val[0]
             self.email = val[1]
         
         # Update the field values
-        if hasattr(self, 'author_field'):
+        if self.author_field is not None:
             self.author_field.value = self.author
             self.email_field.value = self.email
             self.update()
@@ -864,17 +903,73 @@ class FactoryAuthorRow(ft.Row):
 
 
 # MARK: Settings
+@lru_cache(maxsize=1)
+def _toast_radio_specs():
+    """(value, label) pairs for the toast position radios, derived once"""
+    return tuple(
+        (position.value, position.name.replace("_", " ").title())
+        for position in ToastPosition
+    )
+
+# doctor results arriving within this window are sent in one update
+_DOCTOR_UPDATE_DELAY = 0.05
+# doctor messages at least this long are decoded off the event loop
+_DOCTOR_INLINE_PARSE_MAX = 4096
+# component descriptions start after a dash or an opening parenthesis
+_COMPONENT_SUFFIX_RE = re.compile(r'[-(]')
+_STATUS_COLOR = {
+    "PASSED": colors_map["primary"],
+    "WARNING": ft.Colors.AMBER,
+    "FAILED": ft.Colors.RED,
+}
+_STATUS_ICON = {
+    "PASSED": ft.Icons.CHECK_CIRCLE,
+    "FAILED": ft.Icons.ERROR,
+    "WARNING": ft.Icons.WARNING,
+}
+_DEFAULT_STATUS_COLOR = colors_map["text_secondary"]
+_DEFAULT_STATUS_ICON = ft.Icons.INFO
+
+class _DoctorRow(ft.Row):
+    """Doctor result row; its ring, icon and text are mutated, never replaced"""
+    def __init__(self, label):
+        self.label = label
+        self.ring = ft.ProgressRing(width=8, height=8, stroke_width=1, color=colors_map["primary"])
+        self.icon = ft.Icon(name=_DEFAULT_STATUS_ICON, size=12, visible=False)
+        self.text = ft.Text(label, size=10, opacity=0.7)
+        super().__init__([self.ring, self.icon, self.text], spacing=5)
+
+    def reset(self):
+        """Put the row back into its loading state"""
+        self.ring.visible = True
+        self.icon.visible = False
+        self.text.value = self.label
+        self.text.color = None
+        self.text.opacity = 0.7
+
+    def set_status(self, icon_name, color, text):
+        self.ring.visible = False
+        self.icon.visible = True
+        self.icon.name = icon_name
+        self.icon.color = color
+        self.text.value = text
+        self.text.color = color
+        self.text.opacity = None
+
 class FactorySettingsDialog(ft.AlertDialog):
+    # Expected components for Flutter and Flet
+    FLUTTER_EXPECTED_COMPONENTS = (
+        "Flutter", "Android toolchain", "Xcode", "Chrome",
+        "Android Studio", "VS Code", "Connected device"
+    )
+    FLET_EXPECTED_COMPONENTS = (
+        "Flet Version", "Python Version", "Operating System"
+    )
+
     def __init__(self, title="Dialog Title", content=None, actions=None, settings_manager=None):
         self.settings_manager = settings_manager
-        # Create references for components
-        self.flutter_results_ref = ft.Ref[ft.Column]()
-        self.flet_results_ref = ft.Ref[ft.Column]()
-        
-        self.verbose_v_ref = ft.Ref[FactoryCheckBox]()
-        self.verbose_vv_ref = ft.Ref[FactoryCheckBox]()
-        self.toast_position_ref = ft.Ref[ft.RadioGroup]()
-        self.auto_save_ref = ft.Ref[FactoryCheckBox]()
+        # Direct links to the settings controls, filled in by _create_settings_content
+        self._refs = SimpleNamespace(verbose_v=None, verbose_vv=None, toast_position=None, auto_save=None)
 
         title_component = ft.Column(
             [
@@ -899,11 +994,11 @@ class FactorySettingsDialog(ft.AlertDialog):
             actions = [
                 FactorySecondaryButton(
                     ft.Text("Cancel"),
-                    on_click=lambda e: self.on_cancel(e),
+                    on_click=self.on_cancel,
                 ),
                 FactoryButton(
                     ft.Text("Save"),
-                    on_click=lambda e: self.on_save(e),
+                    on_click=self.on_save,
                 ),
             ]
         
@@ -912,82 +1007,90 @@ class FactorySettingsDialog(ft.AlertDialog):
             content=content,
             actions=actions,
             actions_alignment=ft.MainAxisAlignment.END,
+            # clicking outside the (non-modal) dialog closes it without Cancel/Save
+            on_dismiss=self._on_dismiss,
             bgcolor="#ffffff",
             shape=ft.RoundedRectangleBorder(radius=6),
         )
         
-        self.flutter_results = ft.Column(
-            ref=self.flutter_results_ref,
-            controls=[
-                ft.Text("Run Flutter Doctor to see results", 
-                       color=colors_map["text_secondary"],
-                       size=12)
-            ],
-            scroll=ft.ScrollMode.AUTO,
-            spacing=5,
-        )
-
-        self.flet_results = ft.Column(
-            ref=self.flet_results_ref,
-            controls=[
-                ft.Text("Run Flet Doctor to see results",
-                       color=colors_map["text_secondary"],
-                       size=12)
-            ],
-            scroll=ft.ScrollMode.AUTO,
-            spacing=5,
-        )
-        
         # Separate dictionaries for Flutter and Flet result rows
         self.flutter_result_rows = {}
         self.flet_result_rows = {}
+        # lowercased row name -> row key, for matching streamed component names
+        self._flutter_lc_index = {}
+        self._flet_lc_index = {}
+        # expected rows that have not received a status yet
+        self._flutter_pending = set()
+        self._flet_pending = set()
+        # loading rows built on the first run of each doctor and reused after
+        self._flutter_loading_rows = {}
+        self._flet_loading_rows = {}
         
-        # Expected components for Flutter and Flet
-        self.FLUTTER_EXPECTED_COMPONENTS = [
-            "Flutter", "Android toolchain", "Xcode", "Chrome", 
-            "Android Studio", "VS Code", "Connected device"
-        ]
-        
-        self.FLET_EXPECTED_COMPONENTS = [
-            "Flet Version", "Python Version", "Operating System"
-        ]
+        # the settings content is built on first open, see refresh()
+        self._built = False
+        self._update_pending = False
+        # tasks running a doctor, cancelled when the dialog is dismissed
+        self._doctor_tasks = set()
+
+    def refresh(self):
+        """Build the settings content once, then only sync it with current settings"""
+        if not self._built:
+            self._create_settings_content()
+            self._built = True
+        else:
+            self._refresh_dynamic()
 
-        self._create_settings_content()
+    def _refresh_dynamic(self):
+        """Push the current settings into the existing controls"""
+        verbose_level = self.settings_manager.get("verbose_build", 1)
+        self._refs.verbose_v.value = verbose_level == 1
+        self._refs.verbose_vv.value = verbose_level == 2
+        self._refs.toast_position.value = self.settings_manager.get("toast_position", "BOTTOM_RIGHT")
+        self._refs.auto_save.value = self.settings_manager.get("auto_save", False)
 
     def on_cancel(self, e):
         """Cancel button handler - revert to previous settings"""
+        self._cancel_doctors()
         self.open = False
         self.update()
 
     def on_save(self, e):
         """Save button handler - save settings"""
         # Settings are already saved when changed, so just close the dialog
+        self._cancel_doctors()
         self.open = False
         self.update()
+
+    def _on_dismiss(self, e):
+        """Dialog closed some other way than Cancel/Save"""
+        self._cancel_doctors()
+
+    def _cancel_doctors(self):
+        """Stop any doctor still streaming; nobody is left to see its output"""
+        for task in self._doctor_tasks:
+            if not task.done():
+                task.cancel()
     
     def _toggle_verbose_build(self, e):
         """Handle verbose build checkbox changes"""
         # Determine which checkbox was changed
-        if e.control == self.verbose_v_ref.current:
-            if e.control.value:
-                # If -v is checked, uncheck -vv
-                self.verbose_vv_ref.current.value = False
-                self.verbose_vv_ref.current.update()
-                # Set verbose level to 1
-                self.settings_manager.set("verbose_build", 1)
-            else:
-                # If -v is unchecked, set verbose level to 0
-                self.settings_manager.set("verbose_build", 0)
-        elif e.control == self.verbose_vv_ref.current:
-            if e.control.value:
-                # If -vv is checked, uncheck -v
-                self.verbose_v_ref.current.value = False
-                self.verbose_v_ref.current.update()
-                # Set verbose level to 2
-                self.settings_manager.set("verbose_build", 2)
-            else:
-                # If -vv is unchecked, set verbose level to 0
-                self.settings_manager.set("verbose_build", 0)
+        refs = self._refs
+        if e.control == refs.verbose_v:
+            level, other = 1, refs.verbose_vv
+        elif e.control == refs.verbose_vv:
+            level, other = 2, refs.verbose_v
+        else:
+            return
+        
+        if e.control.value:
+            # Checking one level unchecks the other; only send it if it was checked
+            if other.value:
+                other.value = False
+                other.update()
+            self.settings_manager.set("verbose_build", level)
+        else:
+            # Unchecking leaves verbose level 0
+            self.settings_manager.set("verbose_build", 0)
     
     def _on_toast_position_change(self, e):
         """Handle toast position radio changes"""
@@ -1005,14 +1108,12 @@ class FactorySettingsDialog(ft.AlertDialog):
         
         # Create verbose build checkboxes
         verbose_v_checkbox = FactoryCheckBox(
-            ref=self.verbose_v_ref,
             value=verbose_level == 1,
             label="Show detailed build output (-v)",
             on_change=self._toggle_verbose_build
         )
         
         verbose_vv_checkbox = FactoryCheckBox(
-            ref=self.verbose_vv_ref,
             value=verbose_level == 2,
             label="Show very detailed build output (-vv)",
             on_change=self._toggle_verbose_build
@@ -1020,28 +1121,49 @@ class FactorySettingsDialog(ft.AlertDialog):
         
         # Create toast position radio group
         toast_radio_group = ft.RadioGroup(
-            ref=self.toast_position_ref,
             value=toast_position,
             on_change=self._on_toast_position_change,
             content=ft.Row(
                 [
-                    FactoryRadio(
-                        value=position.value,
-                        label=position.name.replace("_", " ").title(),
-                    )
-                    for position in ToastPosition
+                    FactoryRadio(value=value, label=label)
+                    for value, label in _toast_radio_specs()
                 ]
             )
         )
 
         autosave_checkbox = FactoryCheckBox(
-            ref=self.auto_save_ref,
             value=self.settings_manager.get("auto_save", False),
             label="Automatically save changes to pyproject.toml",
             on_change=self._on_auto_save_change
         )
+        refs = self._refs
+        refs.verbose_v = verbose_v_checkbox
+        refs.verbose_vv = verbose_vv_checkbox
+        refs.toast_position = toast_radio_group
+        refs.auto_save = autosave_checkbox
         
-        # Flutter results
+        # Doctor result lists; ListView only builds the rows in view
+        self.flutter_results = ft.ListView(
+            controls=[
+                ft.Text("Run Flutter Doctor to see results", 
+                       color=colors_map["text_secondary"],
+                       size=12)
+            ],
+            spacing=5,
+            auto_scroll=False,
+            height=200,
+        )
+
+        self.flet_results = ft.ListView(
+            controls=[
+                ft.Text("Run Flet Doctor to see results",
+                       color=colors_map["text_secondary"],
+                       size=12)
+            ],
+            spacing=5,
+            auto_scroll=False,
+            height=200,
+        )
         
         # Create the content
         self.content = ft.Container(
@@ -1063,7 +1185,16 @@ class FactorySettingsDialog(ft.AlertDialog):
                         header=ft.Text("Auto Save", font_family="OpenRunde Regular", color=colors_map["text_secondary"]),
                         content=autosave_checkbox
                     ),
-                    ft.Text("Run checks", font_family="OpenRunde Regular", size=12, color="#595b5d"),
+                    ft.Row(
+                        controls=[
+                            ft.Text("Run checks", font_family="OpenRunde Regular", size=12, color="#595b5d"),
+                            FactorySecondaryButton(
+                                ft.Text("Run all"),
+                                on_click=self.execute_all_doctors,
+                            ),
+                        ],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                    ),
                     SettingsItemExpander(
                         "Run Flutter Doctor",
                         content=ft.Column(
@@ -1114,135 +1245,174 @@ class FactorySettingsDialog(ft.AlertDialog):
     def create_loading_rows(self, doctor_type="flutter"):
         """Create initial loading rows for all expected components"""
         if doctor_type == "flutter":
-            self.flutter_results_ref.current.controls.clear()
             self.flutter_result_rows.clear()
             expected_components = self.FLUTTER_EXPECTED_COMPONENTS
             result_rows = self.flutter_result_rows
-            result_column = self.flutter_results_ref.current
+            result_column = self.flutter_results
+            lc_index = self._flutter_lc_index
+            pending = self._flutter_pending
+            loading_rows = self._flutter_loading_rows
         else:  # flet
-            self.flet_results_ref.current.controls.clear()
             self.flet_result_rows.clear()
             expected_components = self.FLET_EXPECTED_COMPONENTS
             result_rows = self.flet_result_rows
-            result_column = self.flet_results_ref.current
+            result_column = self.flet_results
+            lc_index = self._flet_lc_index
+            pending = self._flet_pending
+            loading_rows = self._flet_loading_rows
         
+        lc_index.clear()
+        lc_index.update((c.lower(), c) for c in expected_components)
+        pending.clear()
+        pending.update(expected_components)
+        
+        rows = []
         for component in expected_components:
             # A row with a loading indicator for each expected component
-            result_rows[component] = ft.Row([
-                ft.ProgressRing(width=8, height=8, stroke_width=1, color=colors_map["primary"]),
-                ft.Text(f"{component}", size=10, opacity=0.7)
-            ], spacing=5)
-            result_column.controls.append(result_rows[component])
+            row = loading_rows.get(component)
+            if row is None:
+                row = loading_rows[component] = _DoctorRow(component)
+            else:
+                row.reset()
+            result_rows[component] = row
+            rows.append(row)
+        # replaces the previous run's rows (and the placeholder) in one go
+        result_column.controls = rows
     
     def update_result_row(self, component, status, doctor_type="flutter", version_info=""):
         """Update a row with the result status"""
-        color = colors_map["primary"] if status == "PASSED" else \
-                ft.Colors.AMBER if status == "WARNING" else \
-                ft.Colors.RED if status == "FAILED" else \
-                colors_map["text_secondary"]
-                
-        icon = ft.Icon(
-            name=ft.Icons.CHECK_CIRCLE if status == "PASSED" else \
-                ft.Icons.ERROR if status == "FAILED" else \
-                ft.Icons.WARNING if status == "WARNING" else \
-                ft.Icons.INFO,
-            color=color,
-            size=12
-        )
+        color = _STATUS_COLOR.get(status, _DEFAULT_STATUS_COLOR)
+        icon_name = _STATUS_ICON.get(status, _DEFAULT_STATUS_ICON)
         
         # Clean up component name - remove descriptions after dash or in parentheses
-        display_name = component.split('-')[0].split('(')[0].strip()
+        m = _COMPONENT_SUFFIX_RE.search(component)
+        display_name = (component[:m.start()] if m else component).strip()
+        display_text = f"{display_name}: {version_info}" if version_info else display_name
 
         # Select the appropriate result rows and column
         if doctor_type == "flutter":
             result_rows = self.flutter_result_rows
-            result_column = self.flutter_results_ref.current
+            result_column = self.flutter_results
+            lc_index = self._flutter_lc_index
+            pending = self._flutter_pending
         else:  # flet
             result_rows = self.flet_result_rows
-            result_column = self.flet_results_ref.current
+            result_column = self.flet_results
+            lc_index = self._flet_lc_index
+            pending = self._flet_pending
         
-        # Find a matching component
+        # Find a matching component: exact, then case-insensitive, then substring
         matching_component = component
         if component not in result_rows:
-            for expected in result_rows.keys():
-                if expected.lower() in component.lower() or component.lower() in expected.lower():
-                    matching_component = expected
-                    break
+            component_lc = component.lower()
+            matching_component = lc_index.get(component_lc)
+            if matching_component is None:
+                matching_component = component
+                for expected_lc, expected in lc_index.items():
+                    if expected_lc in component_lc or component_lc in expected_lc:
+                        matching_component = expected
+                        break
         
-        # Create or update row with the status
-        if matching_component in result_rows:
-            result_rows[matching_component].controls = [
-                icon,
-                ft.Text(
-                    f"{display_name}: {version_info}" if version_info else f"{display_name}", 
-                    size=10, 
-                    color=color
-                )
-            ]
+        # Update the row in place
+        row = result_rows.get(matching_component)
+        if row is not None:
+            pending.discard(matching_component)
+            row.set_status(icon_name, color, display_text)
         else:
             # New row for unexpected components
-            new_row = ft.Row([
-                icon,
-                ft.Text(
-                    f"{display_name}: {version_info}" if version_info else f"{display_name}", 
-                    size=10, 
-                    color=color
-                )
-            ], spacing=5)
+            new_row = _DoctorRow(display_text)
+            new_row.set_status(icon_name, color, display_text)
             result_column.controls.append(new_row)
             result_rows[component] = new_row
+            lc_index[component.lower()] = component
         
+    def _safe_update(self):
+        """Update only while the dialog is shown; closed dialogs keep their row state"""
+        if self.open:
+            self.update()
+
+    def _schedule_update(self):
+        """Coalesce bursts of doctor results into one update"""
+        if self._update_pending:
+            return
+        self._update_pending = True
+        asyncio.get_running_loop().call_later(_DOCTOR_UPDATE_DELAY, self._flush_updates)
+
+    def _flush_updates(self):
+        self._update_pending = False
+        self._safe_update()
+
+    async def _run_cancellable(self, stream):
+        """Await a doctor stream as part of the current task, which closing the dialog cancels"""
+        task = asyncio.current_task()
+        self._doctor_tasks.add(task)
+        try:
+            await stream
+        finally:
+            self._doctor_tasks.discard(task)
+
     async def execute_flutter_doctor(self, e):
         """Run flutter doctor and display results"""
         self.create_loading_rows("flutter")
-        self.update()
-        
-        # Run flutter doctor and update UI with results
-        async for result_json in run_flutter_doctor():
-            try:
-                result = json.loads(result_json)
-                # Update component statuses
-                for component, status in result.items():
-                    self.update_result_row(component, status, "flutter")
-                    self.update()
-            except json.JSONDecodeError:
-                print(f"Failed to decode JSON: {result_json}")
-        
-        # Check for any remaining components that didn't get updated
-        for component in list(self.flutter_result_rows.keys()):
-            row = self.flutter_result_rows[component]
-            # If the first control is still a ProgressRing, it means this component wasn't checked
-            if isinstance(row.controls[0], ft.ProgressRing):
-                self.update_result_row(component, "NOT CHECKED", "flutter")
-                
-        self.update()
+        self._safe_update()
+        await self._run_cancellable(self._run_doctor("flutter", run_flutter_doctor))
+        self._safe_update()
     
     async def execute_flet_doctor(self, e):
         """Run flet doctor and display results"""
         self.create_loading_rows("flet")
-        self.update()
-        
-        # Run flet doctor and update UI with results
-        async for result_json in run_flet_doctor():
-            try:
-                result = json.loads(result_json)
-                # Update component statuses
-                for component, status in result.items():
-                    if component != "version_info":  # Skip the version_info key
-                        version_info = result.get("version_info", "")
-                        self.update_result_row(component, status, "flet", version_info)
-                        self.update()
-            except json.JSONDecodeError:
-                print(f"Failed to decode JSON: {result_json}")
+        self._safe_update()
+        await self._run_cancellable(self._run_doctor("flet", run_flet_doctor, with_version=True))
+        self._safe_update()
+
+    async def execute_all_doctors(self, e):
+        """Run both doctors concurrently; each waits on its own subprocess stream"""
+        self.create_loading_rows("flutter")
+        self.create_loading_rows("flet")
+        self._safe_update()
+        await self._run_cancellable(
+            asyncio.gather(
+                self._run_doctor("flutter", run_flutter_doctor),
+                self._run_doctor("flet", run_flet_doctor, with_version=True),
+            )
+        )
+        self._safe_update()
+
+    @staticmethod
+    async def _parse_doctor_line(loop, result_json):
+        """Decode one streamed doctor message, or None for noise and malformed input"""
+        line = result_json.strip()
+        # cheap shape check so non-JSON lines never pay for a decode exception
+        if not (line.startswith("{") and line.endswith("}")):
+            return None
+        try:
+            if len(line) < _DOCTOR_INLINE_PARSE_MAX:
+                return loads_json(line)
+            return await loop.run_in_executor(None, loads_json, line)
+        except ValueError:
+            log.warning("Failed to decode JSON: %s", result_json)
+            return None
+
+    async def _run_doctor(self, doctor_type, stream_fn, with_version=False):
+        """Apply a doctor's streamed results to its loading rows"""
+        loop = asyncio.get_running_loop()
+        version_info = ""
+        async for result_json in stream_fn():
+            result = await self._parse_doctor_line(loop, result_json)
+            if result is None:
+                continue
+            if with_version:
+                # the version_info key annotates the other components, it isn't one
+                version_info = result.pop("version_info", "")
+            # Update component statuses
+            for component, status in result.items():
+                self.update_result_row(component, status, doctor_type, version_info)
+            self._schedule_update()
         
-        # Check for any remaining components that didn't get updated
-        for component in list(self.flet_result_rows.keys()):
-            row = self.flet_result_rows[component]
-            # If the first control is still a ProgressRing, it means this component wasn't checked
-            if isinstance(row.controls[0], ft.ProgressRing):
-                self.update_result_row(component, "NOT CHECKED", "flet")
-                
-        self.update()
+        # Components that never got a status weren't checked
+        pending = self._flutter_pending if doctor_type == "flutter" else self._flet_pending
+        for component in tuple(pending):
+            self.update_result_row(component, "NOT CHECKED", doctor_type)
 
 class SettingsItemExpander(ft.Container):
     def __init__(
@@ -1261,6 +1431,12 @@ class SettingsItemExpander(ft.Container):
 
         self._expanded = expand
         self._width = width
+        # header corners for the expanded / collapsed states, swapped on toggle
+        self._br_open = ft.border_radius.only(
+            top_left=self.corner_radius,
+            top_right=self.corner_radius,
+        )
+        self._br_closed = ft.border_radius.all(self.corner_radius)
         self._header = (
             header
             if isinstance(header, ft.Control)
@@ -1311,20 +1487,11 @@ class SettingsItemExpander(ft.Container):
             ),
             height=50,
             on_click=self._toggle,
-            border_radius=ft.border_radius.only(
-                top_left=self.corner_radius,
-                top_right=self.corner_radius,
-                bottom_left=self.corner_radius if not self._expanded else 0,
-                bottom_right=self.corner_radius if not self._expanded else 0,
-            ),
+            border_radius=self._br_open if self._expanded else self._br_closed,
             padding=10,
             bgcolor=self.bg_color,
             border=ft.border.all(1, self.border_color),
             width=self._width,
-            animate=ft.animation.Animation(
-                duration=300,
-                curve=ft.AnimationCurve.EASE_OUT,
-            ),
         )
 
         self._header_row = header_row
@@ -1377,12 +1544,7 @@ class SettingsItemExpander(ft.Container):
 
         self._expand_icon.icon = ft.Icons.EXPAND_LESS if self._expanded else ft.Icons.EXPAND_MORE
 
-        self._header_row.border_radius = ft.border_radius.only(
-            top_left=self.corner_radius,
-            top_right=self.corner_radius,
-            bottom_left=self.corner_radius if not self._expanded else 0,
-            bottom_right=self.corner_radius if not self._expanded else 0,
-        )
+        self._header_row.border_radius = self._br_open if self._expanded else self._br_closed
 
         self.update()
 
@@ -1402,12 +1564,7 @@ class SettingsItemExpander(ft.Container):
             self._expand_icon.icon = ft.Icons.EXPAND_LESS if value else ft.Icons.EXPAND_MORE
 
             # Update header border radius
-            self._header_row.border_radius = ft.border_radius.only(
-                top_left=self.corner_radius,
-                top_right=self.corner_radius,
-                bottom_left=self.corner_radius if not value else 0,
-                bottom_right=self.corner_radius if not value else 0,
-            )
+            self._header_row.border_radius = self._br_open if value else self._br_closed
 
             self.update()
 
@@ -1452,7 +1609,8 @@ class FactoryHeader(ft.Row):
     
     def open_settings_dialog(self, e):
         """Open the settings dialog when the button is clicked"""
-        print("Opening settings dialog")
+        log.debug("opening settings dialog")
+        self._settings_dialog.refresh()
         self.page.open(self._settings_dialog)
 
     async def _execute_flutter_doctor(self, e):